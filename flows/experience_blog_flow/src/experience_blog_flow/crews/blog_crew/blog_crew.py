@@ -1,46 +1,76 @@
 #!/usr/bin/env python
 import sys
 import os
+import logging
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from importlib.resources import files
 from pathlib import Path
+from typing import Dict, List, Optional
 
 # FIRST: Set up paths before any imports that depend on them
-current_file = Path(__file__)
-
-# Find the actual project root by looking for pyproject.toml
-def find_project_root(start_path):
-    """Find project root by looking for pyproject.toml"""
-    current_path = Path(start_path).resolve()
-    while current_path.parent != current_path:  # Not at filesystem root
-        if (current_path / 'pyproject.toml').exists():
-            return current_path
-        current_path = current_path.parent
-    return None
-
-project_root = find_project_root(current_file)
-if project_root is None:
-    # Fallback to relative path calculation
-    project_root = current_file.parent.parent.parent.parent.parent.parent
+# Repository root (holds the shared helpers/ and tools/ packages), resolved once at import.
+# Set CREWAI_PROJECT_ROOT to override when the flow is installed outside the repository.
+project_root = Path(os.environ.get("CREWAI_PROJECT_ROOT") or Path(__file__).resolve().parents[6])
 
 # Add project root to path for shared components
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 # Now import everything
-from crewai import Agent, Crew, Process, Task
+from crewai import Agent, Crew, LLM, Process, Task
 from crewai.project import CrewBase, agent, crew, task
-from crewai_tools import ScrapeWebsiteTool, FileReadTool, DirectoryReadTool
+from crewai.tasks.task_output import TaskOutput
+from pydantic import BaseModel
 
 # Import tools and helpers (should work now with path set)
 from tools.search_tool import search_tool
-from helpers.llm_helper import LLMHelper
+from tools.bulk_scrape_tool import bulk_scrape_tool
+from helpers.llm_helper import get_llm_helper
+
+
+logger = logging.getLogger(__name__)
+
+# Package config directory, resolved once through the import system
+_CONFIG_DIR = files("experience_blog_flow") / "config"
+
+# Agents of this crew; their LLMs are independent, so they are created concurrently
+AGENT_NAMES = ('coach', 'researcher', 'writer', 'blog_writer')
+
+
+def _crew_verbose() -> bool:
+    """Crew-level step logging is synchronous console output; opt in with CREW_VERBOSE=1"""
+    # Read when the crew is built, after LLMHelper has loaded .env
+    return os.getenv("CREW_VERBOSE") == "1"
+
+
+@cache
+def _crewai_tools():
+    """Import crewai_tools on first use; it pulls in heavy optional dependencies"""
+    import crewai_tools
+    return crewai_tools
+
+
+def _scrape_website_tool():
+    """Create a scrape tool that reuses the shared pooled HTTP client"""
+    from tools.scrape_tool import PooledScrapeWebsiteTool
+    return PooledScrapeWebsiteTool()
+
+
+class BlogDraftBatch(BaseModel):
+    """Structured output for a batch of first-stage drafts"""
+    drafts: List[str]
 
 
 @CrewBase
 class BlogCrew:
     """Experience Blog Creation Crew
     
-    A simplified single-agent crew for transforming personal experiences 
-    into comprehensive blog posts with research and context.
+    A crew for transforming personal experiences into comprehensive blog posts.
+    Analysis and research fan out in parallel, then the writers fan in on both results.
     """
 
     agents_config = "../../config/agents.yaml"
@@ -48,38 +78,114 @@ class BlogCrew:
 
     def __init__(self):
         super().__init__()
-        # Set config path relative to the crew file location
-        config_path = Path(__file__).parent.parent.parent / "config" / "agents.yaml"
-        self.llm_helper = LLMHelper(str(config_path))
+        self.llm_helper = get_llm_helper(str(_CONFIG_DIR / "agents.yaml"))
+        self.agent_llms = self._build_agent_llms_parallel()
+        # Every finished task is written here as soon as it completes (in completion order);
+        # the directory is created by the first task callback, so only a kickoff owns one
+        self.task_output_dir: Optional[Path] = None
+        self.task_output_files: List[Path] = []
+        # Async tasks finish on worker threads, so their callbacks can run at the same time
+        self._task_output_lock = threading.Lock()
+
+    def _build_agent_llms_parallel(self) -> Dict[str, LLM]:
+        """Create every agent's LLM at once instead of one per @agent call, in turn"""
+        with ThreadPoolExecutor(max_workers=len(AGENT_NAMES), thread_name_prefix="crew-llm") as executor:
+            return dict(zip(AGENT_NAMES, executor.map(self.llm_helper.create_llm_instance, AGENT_NAMES)))
+
+    def _write_task_output(self, output: TaskOutput) -> None:
+        """Task callback: write the task's raw output to disk as soon as the task completes"""
+        name = output.name or output.description[:20]
+        safe_name = "".join(char if char.isalnum() else "_" for char in name)
+        with self._task_output_lock:
+            if self.task_output_dir is None:
+                self.task_output_dir = Path(tempfile.mkdtemp(prefix="experience_blog_"))
+            file_path = self.task_output_dir / f"task_{safe_name}.md"
+            file_path.write_text(output.raw or "", encoding='utf-8')
+            self.task_output_files.append(file_path)
+
+    def cleanup_task_outputs(self) -> None:
+        """Remove the temporary task output directory, if a kickoff created one"""
+        with self._task_output_lock:
+            task_output_dir, self.task_output_dir = self.task_output_dir, None
+            self.task_output_files = []
+        if task_output_dir is not None:
+            shutil.rmtree(task_output_dir, ignore_errors=True)
+
+    @agent
+    def coach(self) -> Agent:
+        """Experience Analyst agent for extracting themes and lessons from the experience"""
+        config = self.agents_config['coach']
+        return Agent(
+            config=config,
+            llm=self.agent_llms['coach'],
+            verbose=config.get('verbose', False)
+        )
+
+    @agent
+    def researcher(self) -> Agent:
+        """Technical Researcher agent for gathering industry context around the experience"""
+        config = self.agents_config['researcher']
+        return Agent(
+            config=config,
+            llm=self.agent_llms['researcher'],
+            tools=[
+                search_tool,
+                _scrape_website_tool(),
+                bulk_scrape_tool
+            ],
+            verbose=config.get('verbose', False)
+        )
 
     @agent
     def writer(self) -> Agent:
         """Expert Blog Writer agent for creating comprehensive blog posts from personal experiences"""
+        config = self.agents_config['writer']
         return Agent(
-            config=self.agents_config['writer'],
-            llm=self.llm_helper.create_llm_instance('writer'),
+            config=config,
+            llm=self.agent_llms['writer'],
             tools=[
                 search_tool,
-                ScrapeWebsiteTool(),
-                FileReadTool(),
-                DirectoryReadTool()
+                _scrape_website_tool(),
+                bulk_scrape_tool,
+                _crewai_tools().FileReadTool(),
+                _crewai_tools().DirectoryReadTool()
             ],
-            verbose=self.agents_config['writer'].get('verbose', True)
+            verbose=config.get('verbose', True)
         )
 
     @agent 
     def blog_writer(self) -> Agent:
         """Long-form blog writer agent for polishing and expanding initial drafts"""
+        config = self.agents_config['blog_writer']
         return Agent(
-            config=self.agents_config['blog_writer'],
-            llm=self.llm_helper.create_llm_instance('blog_writer'),
+            config=config,
+            llm=self.agent_llms['blog_writer'],
             tools=[
                 search_tool,
-                ScrapeWebsiteTool(),
-                FileReadTool(),
-                DirectoryReadTool()
+                _scrape_website_tool(),
+                bulk_scrape_tool,
+                _crewai_tools().FileReadTool(),
+                _crewai_tools().DirectoryReadTool()
             ],
-            verbose=self.agents_config['blog_writer'].get('verbose', True)
+            verbose=config.get('verbose', True)
+        )
+
+    @task
+    def analyze_experience(self) -> Task:
+        """Analyze the experience for themes and outcomes (runs concurrently with research)"""
+        return Task(
+            config=self.tasks_config['analyze_experience'],
+            agent=self.coach(),
+            async_execution=True
+        )
+
+    @task
+    def research_context(self) -> Task:
+        """Research industry context for the experience (runs concurrently with analysis)"""
+        return Task(
+            config=self.tasks_config['research_context'],
+            agent=self.researcher(),
+            async_execution=True
         )
 
     @task
@@ -87,7 +193,8 @@ class BlogCrew:
         """Transform personal experience into a comprehensive blog post with research and context"""
         return Task(
             config=self.tasks_config['task_experience_blog'],
-            agent=self.writer()
+            agent=self.writer(),
+            context=[self.analyze_experience(), self.research_context()]  # Waits for both async tasks
         )
 
     @task
@@ -96,21 +203,64 @@ class BlogCrew:
         return Task(
             config=self.tasks_config['rewrite_and_expand_blog_post'],
             agent=self.blog_writer(),
-            context=[self.create_blog_from_experience()]  # Depends on the first task
+            # Reuses the parallel research so the expansion stage does not redo it
+            context=[self.create_blog_from_experience(), self.research_context()]
         )
 
+    def kickoff_batch(self, experiences: List[Dict[str, str]], k: int = 4) -> List[str]:
+        """Draft short first-stage posts for many experiences, K experiences per LLM request.
+
+        Stuffing several experiences into one prompt shares the instructions and the
+        request overhead across them. Only use this for short drafts; polishing should
+        still run per experience through the full crew.
+
+        Args:
+            experiences: Dicts with an 'experience_text' key
+            k: Number of experiences per request
+
+        Returns:
+            One draft per input experience, in input order (empty string if the model skipped one)
+        """
+        drafts: List[str] = []
+        for start in range(0, len(experiences), k):
+            chunk = experiences[start:start + k]
+            numbered = "\n\n".join(
+                f"{index}. {experience['experience_text'].strip()}"
+                for index, experience in enumerate(chunk, 1)
+            )
+
+            draft_task = Task(
+                config=self.tasks_config['draft_experience_batch'],
+                agent=self.writer(),
+                output_pydantic=BlogDraftBatch
+            )
+            result = Crew(
+                agents=[draft_task.agent],
+                tasks=[draft_task],
+                process=Process.sequential,
+                verbose=False
+            ).kickoff(inputs={
+                'experience_count': len(chunk),
+                'experiences': numbered,
+                'experience_text': numbered
+            })
+
+            batch = list(result.pydantic.drafts) if result.pydantic else []
+            # Route drafts back to their inputs; pad if the model returned fewer
+            drafts.extend((batch + [""] * len(chunk))[:len(chunk)])
+
+        return drafts
+
     @crew
     def crew(self) -> Crew:
-        """Creates the Two-Stage Experience Blog Creation Crew"""
-        print("🚀 Starting Two-Stage Experience Blog Crew")
-        print("📝 Stage 1: Research Writer - Create initial blog with research and context")
-        print("✨ Stage 2: Blog Writer - Expand and polish into publication-ready article")
-        print("🎯 Input: Experience Text → Output: Polished Long-Form Blog Post")
+        """Creates the Experience Blog Creation Crew (parallel analysis + research, then two writing stages)"""
+        logger.info("Starting Experience Blog Crew: coach + researcher (parallel) -> writer -> blog_writer")
 
         return Crew(
             agents=self.agents,
             tasks=self.tasks,
             process=Process.sequential,
-            verbose=True,
-            max_execution_time=None
+            verbose=_crew_verbose(),
+            max_execution_time=None,
+            task_callback=self._write_task_output
         )
\ No newline at end of file
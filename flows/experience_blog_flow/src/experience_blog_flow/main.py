@@ -1,13 +1,16 @@
 #!/usr/bin/env python
-import sys
-import os
+import asyncio
+import logging
+import threading
+from typing import List, Tuple
 from crewai.flow.flow import Flow, listen, start
 from pydantic import BaseModel
 from experience_blog_flow.crews.blog_crew.blog_crew import BlogCrew
 
-# Add helpers to path for output functionality
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..', 'helpers'))
-from output_helper import output_helper
+# The crew module puts the project root on sys.path (or helpers is installed via `pip install -e .`)
+from helpers.output_helper import output_helper
+
+logger = logging.getLogger(__name__)
 
 
 class ExperienceBlogState(BaseModel):
@@ -28,7 +31,7 @@ class ExperienceBlogFlow(Flow[ExperienceBlogState]):
     """
     
     @start()
-    def create_blog_from_experience(self):
+    async def create_blog_from_experience(self):
         """
         Create a blog post from personal experience using the blog creation crew
         """
@@ -39,58 +42,83 @@ class ExperienceBlogFlow(Flow[ExperienceBlogState]):
             'experience_text': self.state.experience_text
         }
         
-        result = BlogCrew().crew().kickoff(inputs=inputs)
+        blog_crew = BlogCrew()
+        try:
+            result = await blog_crew.crew().kickoff_async(inputs=inputs)
         
-        # Save the generated blog content to file
-        if result:
-            blog_content = None
+            # Save the generated blog content to file
+            if result:
+                blog_content = None
             
-            # Handle different result formats
-            if hasattr(result, 'tasks_output') and result.tasks_output:
-                # Extract the final task output (expanded blog post)
-                final_task = result.tasks_output[-1]  # Last task should be the expanded version
-                if hasattr(final_task, 'raw'):
-                    blog_content = final_task.raw
-                elif hasattr(final_task, 'output'):
-                    blog_content = final_task.output
-            elif hasattr(result, 'raw'):
-                blog_content = result.raw
+                # Handle different result formats
+                if hasattr(result, 'tasks_output') and result.tasks_output:
+                    # Extract the final task output (expanded blog post)
+                    final_task = result.tasks_output[-1]  # Last task should be the expanded version
+                    if hasattr(final_task, 'raw'):
+                        blog_content = final_task.raw
+                    elif hasattr(final_task, 'output'):
+                        blog_content = final_task.output
+                elif hasattr(result, 'raw'):
+                    blog_content = result.raw
             
-            if blog_content and blog_content.strip() and blog_content != "The polished, expanded, and publication-ready blog post is above.":
-                # Create metadata for the file
-                metadata = {
-                    'topic': self.state.experience_topic,
-                    'flow': 'experience_blog_two_stage',
-                    'agents': 'research_writer + blog_writer', 
-                    'generated_at': output_helper._generate_timestamp(),
-                    'input_length': len(self.state.experience_text)
-                }
+                if blog_content and blog_content.strip() and blog_content != "The polished, expanded, and publication-ready blog post is above.":
+                    # Create metadata for the file
+                    metadata = {
+                        'topic': self.state.experience_topic,
+                        'flow': 'experience_blog_two_stage',
+                        'agents': 'coach + researcher + research_writer + blog_writer', 
+                        'generated_at': output_helper.generate_timestamp(),
+                        'input_length': len(self.state.experience_text)
+                    }
                 
-                # Save content to organized output directory
-                saved_path = output_helper.save_content(
-                    flow_name='experience_blog',
-                    content=blog_content,
-                    filename_prefix='polished_blog_post',
-                    file_extension='md',
-                    include_timestamp=True,
-                    metadata=metadata
-                )
+                    # The task callback already wrote the final output to disk - move it
+                    # into the organized output directory instead of writing it again
+                    final_output_file = blog_crew.task_output_files[-1] if blog_crew.task_output_files else None
+                    if final_output_file is not None and final_output_file.exists():
+                        saved_path = await output_helper.amove_content(
+                            flow_name='experience_blog',
+                            source_path=final_output_file,
+                            filename_prefix='polished_blog_post',
+                            file_extension='md',
+                            include_timestamp=True,
+                            metadata=metadata,
+                            timestamp=metadata['generated_at']
+                        )
+                    else:
+                        # Save content to organized output directory (off the event loop)
+                        saved_path = await output_helper.asave_content(
+                            flow_name='experience_blog',
+                            content=blog_content,
+                            filename_prefix='polished_blog_post',
+                            file_extension='md',
+                            include_timestamp=True,
+                            metadata=metadata,
+                            timestamp=metadata['generated_at']
+                        )
                 
-                print(f"💾 Polished blog post saved to: {saved_path}")
+                    print(f"💾 Polished blog post saved to: {saved_path}")
                 
-                # Store the content in state for potential downstream use
-                self.state.blog_content = blog_content
-            else:
-                print("⚠️ No valid blog content found in result to save")
+                    # Store the content in state for potential downstream use
+                    self.state.blog_content = blog_content
+                else:
+                    print("⚠️ No valid blog content found in result to save")
                 
-                # Debug: print result structure
-                if hasattr(result, 'tasks_output'):
-                    print(f"📊 Found {len(result.tasks_output)} task outputs")
-                    for i, task_out in enumerate(result.tasks_output):
-                        if hasattr(task_out, 'raw'):
-                            print(f"  Task {i+1} content length: {len(task_out.raw)} chars")
-                        elif hasattr(task_out, 'output'):
-                            print(f"  Task {i+1} output length: {len(task_out.output)} chars")
+                    # Debug: log result structure
+                    if logger.isEnabledFor(logging.DEBUG) and hasattr(result, 'tasks_output'):
+                        logger.debug(f"Found {len(result.tasks_output)} task outputs")
+                        for i, task_out in enumerate(result.tasks_output):
+                            if hasattr(task_out, 'raw'):
+                                logger.debug(f"Task {i+1} content length: {len(task_out.raw)} chars")
+                            elif hasattr(task_out, 'output'):
+                                logger.debug(f"Task {i+1} output length: {len(task_out.output)} chars")
+        finally:
+            # Remove the temporary task files in the background instead of before returning
+            # (also when the crew fails); a non-daemon thread so the interpreter still
+            # finishes the cleanup at exit
+            threading.Thread(
+                target=blog_crew.cleanup_task_outputs,
+                name="experience-blog-cleanup"
+            ).start()
         
         print("✅ Experience blog creation completed!")
         return result
@@ -110,6 +138,55 @@ def kickoff(experience_text: str = "", experience_topic: str = "Personal Develop
     return flow.kickoff()
 
 
+async def akickoff(experience_text: str = "", experience_topic: str = "Personal Development Experience"):
+    """
+    Run the experience blog flow without blocking the event loop.
+    
+    Args:
+        experience_text: The personal experience to transform into a blog post
+        experience_topic: A short topic description for the experience
+    """
+    flow = ExperienceBlogFlow()
+    flow.state.experience_text = experience_text
+    flow.state.experience_topic = experience_topic
+    return await flow.kickoff_async()
+
+
+async def akickoff_many(experiences: List[Tuple[str, str]], max_concurrency: int = 4):
+    """
+    Run one experience blog flow per input concurrently.
+    
+    The LLM provider (Ollama, OpenAI or GitHub Models) is the real bottleneck here,
+    so set max_concurrency to the number of parallel requests the provider accepts
+    (e.g. OLLAMA_NUM_PARALLEL or the API's connection limit).
+    
+    Args:
+        experiences: List of (experience_text, experience_topic) tuples
+        max_concurrency: Maximum number of flows running at the same time
+        
+    Returns:
+        List of flow results in the same order as the inputs
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _run_one(experience_text: str, experience_topic: str):
+        async with semaphore:
+            return await akickoff(experience_text, experience_topic)
+
+    return await asyncio.gather(*(_run_one(text, topic) for text, topic in experiences))
+
+
+def kickoff_many(experiences: List[Tuple[str, str]], max_concurrency: int = 4):
+    """
+    Run the experience blog flow for many experiences in parallel.
+    
+    Args:
+        experiences: List of (experience_text, experience_topic) tuples
+        max_concurrency: Maximum number of flows running at the same time
+    """
+    return asyncio.run(akickoff_many(experiences, max_concurrency))
+
+
 def plot():
     """
     Plot the experience blog flow.
@@ -1,17 +1,41 @@
 #!/usr/bin/env python
-from crewai import Agent, Crew, Process, Task
+from crewai import Agent, Crew, LLM, Process, Task
 from crewai.project import CrewBase, agent, crew, task
-from crewai_tools import ScrapeWebsiteTool
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from importlib.resources import files
 from pathlib import Path
+from typing import Dict
 
 # Add project root to path for shared components
-project_root = Path(__file__).parent.parent.parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
+project_root = Path(os.environ.get("CREWAI_PROJECT_ROOT") or Path(__file__).resolve().parents[6])
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from tools.search_tool import search_tool
-from helpers.llm_helper import LLMHelper
+from tools.bulk_scrape_tool import bulk_scrape_tool
+from helpers.llm_helper import get_llm_helper
+
+# Package config directory, resolved once through the import system
+_CONFIG_DIR = files("linkedin_content_flow") / "config"
+
+# Agents of this crew; their LLMs are independent, so they are created concurrently
+AGENT_NAMES = ('coach', 'researcher', 'writer', 'influencer')
+
+
+@cache
+def _crewai_tools():
+    """Import crewai_tools on first use; it pulls in heavy optional dependencies"""
+    import crewai_tools
+    return crewai_tools
+
+
+def _scrape_website_tool():
+    """Create a scrape tool that reuses the shared pooled HTTP client"""
+    from tools.scrape_tool import PooledScrapeWebsiteTool
+    return PooledScrapeWebsiteTool()
 
 
 @CrewBase
@@ -27,45 +51,55 @@ class ContentCrew:
 
     def __init__(self):
         super().__init__()
-        self.llm_helper = LLMHelper()
+        self.llm_helper = get_llm_helper(str(_CONFIG_DIR / "agents.yaml"))
+        self.agent_llms = self._build_agent_llms_parallel()
+
+    def _build_agent_llms_parallel(self) -> Dict[str, LLM]:
+        """Create every agent's LLM at once instead of one per @agent call, in turn"""
+        with ThreadPoolExecutor(max_workers=len(AGENT_NAMES), thread_name_prefix="crew-llm") as executor:
+            return dict(zip(AGENT_NAMES, executor.map(self.llm_helper.create_llm_instance, AGENT_NAMES)))
 
     @agent
     def coach(self) -> Agent:
         """Senior Career Coach agent with search capabilities"""
+        config = self.agents_config['coach']
         return Agent(
-            config=self.agents_config['coach'],
-            llm=self.llm_helper.create_llm_instance('coach'),
+            config=config,
+            llm=self.agent_llms['coach'],
             tools=[search_tool],
-            verbose=self.agents_config['coach'].get('verbose', False)
+            verbose=config.get('verbose', False)
         )
 
     @agent
     def researcher(self) -> Agent:
         """Content Researcher agent for in-depth article research"""
+        config = self.agents_config['researcher']
         return Agent(
-            config=self.agents_config['researcher'],
-            llm=self.llm_helper.create_llm_instance('researcher'),
-            tools=[search_tool, ScrapeWebsiteTool()],
-            verbose=self.agents_config['researcher'].get('verbose', False)
+            config=config,
+            llm=self.agent_llms['researcher'],
+            tools=[search_tool, _scrape_website_tool(), bulk_scrape_tool],
+            verbose=config.get('verbose', False)
         )
 
     @agent
     def writer(self) -> Agent:
         """Tech Thought Leadership Writer agent for blog content creation"""
+        config = self.agents_config['writer']
         return Agent(
-            config=self.agents_config['writer'],
-            llm=self.llm_helper.create_llm_instance('writer'),
-            tools=[search_tool, ScrapeWebsiteTool()],
-            verbose=self.agents_config['writer'].get('verbose', False)
+            config=config,
+            llm=self.agent_llms['writer'],
+            tools=[search_tool, _scrape_website_tool(), bulk_scrape_tool],
+            verbose=config.get('verbose', False)
         )
         
     @agent
     def influencer(self) -> Agent:
         """LinkedIn Influencer Writer agent for content creation"""
+        config = self.agents_config['influencer']
         return Agent(
-            config=self.agents_config['influencer'],
-            llm=self.llm_helper.create_llm_instance('influencer'),
-            verbose=self.agents_config['influencer'].get('verbose', False)
+            config=config,
+            llm=self.agent_llms['influencer'],
+            verbose=config.get('verbose', False)
         )
 
     @task
@@ -73,7 +107,8 @@ class ContentCrew:
         """Research task for finding trending skills"""
         return Task(
             config=self.tasks_config['task_search'],
-            agent=self.coach()
+            agent=self.coach(),
+            async_execution=True
         )
 
     @task
@@ -82,7 +117,7 @@ class ContentCrew:
         return Task(
             config=self.tasks_config['task_research'],
             agent=self.researcher(),
-            context=[self.search_trending_skills()]
+            async_execution=True
         )
 
     @task
@@ -91,7 +126,7 @@ class ContentCrew:
         return Task(
             config=self.tasks_config['task_blog'],
             agent=self.writer(),
-            context=[self.research_topic()]
+            context=[self.search_trending_skills(), self.research_topic()]  # Waits for both async tasks
         )
 
     @task
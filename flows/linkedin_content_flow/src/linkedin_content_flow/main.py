@@ -1,13 +1,49 @@
 #!/usr/bin/env python
-import sys
+import asyncio
 import os
+import re
+import sys
+from typing import List, Optional
 from crewai.flow.flow import Flow, listen, start
+from dotenv import load_dotenv
 from pydantic import BaseModel
 from linkedin_content_flow.crews.content_crew.content_crew import ContentCrew
 
-# Add helpers to path for output functionality
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..', 'helpers'))
-from output_helper import output_helper
+# The crew module puts the project root on sys.path (or helpers is installed via `pip install -e .`)
+from helpers.output_helper import output_helper
+
+# Parallel flows are bounded by how many requests the model server handles at once
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Output slot of each ContentCrew task, in the crew's task order
+TASK_SLOTS = ('trending_skills', 'research', 'blog', 'linkedin_post')
+
+# Flow state field filled from each output slot
+STATE_FIELDS = {
+    'research': 'research_results',
+    'blog': 'blog_content',
+    'linkedin_post': 'linkedin_post'
+}
+
+# Number of leading characters inspected when classifying an unexpected extra output
+CLASSIFY_PREFIX_LENGTH = 200
+_BLOG_MARKERS = re.compile(r"blog|article|post")
+
+
+def _classify_output(index: int, content: str) -> str:
+    """Return the output slot for a task output, sniffing the content only past the known tasks"""
+    if index < len(TASK_SLOTS):
+        return TASK_SLOTS[index]
+
+    # Lower-case only the inspected prefix, not the whole output
+    prefix = content[:CLASSIFY_PREFIX_LENGTH].lower()
+    if 'linkedin' in prefix:
+        return 'linkedin_post'
+    if 'research' in prefix:
+        return 'research'
+    if _BLOG_MARKERS.search(prefix):
+        return 'blog'
+    return f'output_{index}'
 
 
 class LinkedInContentState(BaseModel):
@@ -28,7 +64,7 @@ class LinkedInContentFlow(Flow[LinkedInContentState]):
     """
     
     @start()
-    def generate_content(self):
+    async def generate_content(self):
         """
         Generate LinkedIn content using the content creation crew
         """
@@ -40,7 +76,7 @@ class LinkedInContentFlow(Flow[LinkedInContentState]):
             'current_year': self.state.current_year
         }
         
-        result = ContentCrew().crew().kickoff(inputs=inputs)
+        result = await ContentCrew().crew().kickoff_async(inputs=inputs)
         
         # Save the generated content to files
         if result and hasattr(result, 'tasks_output'):
@@ -50,52 +86,56 @@ class LinkedInContentFlow(Flow[LinkedInContentState]):
             metadata = {
                 'topic': self.state.topic,
                 'flow': 'linkedin_content',
-                'generated_at': output_helper._generate_timestamp(),
+                'generated_at': output_helper.generate_timestamp(),
                 'year': self.state.current_year
             }
             
-            outputs_to_save = {}
+            save_options = {
+                'file_extension': 'md',
+                'include_timestamp': True,
+                'metadata': metadata,
+                'timestamp': metadata['generated_at']
+            }
+            pending_saves = {}
+            
+            def queue_save(output_type: str, content: str):
+                # Start writing off the event loop right away, while later outputs are classified
+                pending_saves[output_type] = asyncio.create_task(output_helper.asave_content(
+                    'linkedin_content',
+                    content,
+                    filename_prefix=f'content_{output_type}',
+                    **save_options
+                ))
             
             # Process each task output
             for i, task_output in enumerate(result.tasks_output):
                 if hasattr(task_output, 'raw'):
                     content = task_output.raw
                     
-                    # Determine content type based on task order or content
-                    if i == 0 or 'research' in content.lower()[:200]:
-                        outputs_to_save['research'] = content
-                    elif i == 1 or any(word in content.lower()[:200] for word in ['blog', 'article', 'post']):
-                        outputs_to_save['blog'] = content
-                    elif i == 2 or 'linkedin' in content.lower()[:200]:
-                        outputs_to_save['linkedin_post'] = content
-                    else:
-                        outputs_to_save[f'output_{i}'] = content
+                    # Determine content type from the task order
+                    output_type = _classify_output(i, content)
+                    if output_type in pending_saves:
+                        output_type = f'output_{i}'
+                    queue_save(output_type, content)
+                    
+                    # Store relevant content in state
+                    if output_type in STATE_FIELDS:
+                        setattr(self.state, STATE_FIELDS[output_type], content)
             
             # If we have consolidated output, save that too
             if hasattr(result, 'raw') and result.raw:
-                outputs_to_save['complete'] = result.raw
+                queue_save('complete', result.raw)
             
-            # Save all outputs with organized naming
-            if outputs_to_save:
-                saved_files = output_helper.save_multiple_outputs(
-                    flow_name='linkedin_content',
-                    outputs=outputs_to_save,
-                    filename_prefix='content',
-                    file_extension='md',
-                    include_timestamp=True,
-                    metadata=metadata
-                )
-                
-                for output_type, file_path in saved_files.items():
-                    print(f"💾 {output_type.title()} content saved to: {file_path}")
+            # Wait for all outputs to be written
+            if pending_saves:
+                saved_paths = await asyncio.gather(*pending_saves.values())
+                saved_files = dict(zip(pending_saves, saved_paths))
                 
-                # Store relevant content in state
-                if 'blog' in outputs_to_save:
-                    self.state.blog_content = outputs_to_save['blog']
-                if 'linkedin_post' in outputs_to_save:
-                    self.state.linkedin_post = outputs_to_save['linkedin_post']
-                if 'research' in outputs_to_save:
-                    self.state.research_results = outputs_to_save['research']
+                # One print per flow, so lines from concurrent flows don't interleave
+                print("\n".join(
+                    f"💾 {output_type.title()} content saved to: {file_path}"
+                    for output_type, file_path in saved_files.items()
+                ))
         
         print("✅ LinkedIn content generation completed!")
         return result
@@ -113,6 +153,75 @@ def kickoff(topic: str = "AI-powered development tools"):
     return flow.kickoff()
 
 
+async def akickoff(topic: str = "AI-powered development tools"):
+    """
+    Run the LinkedIn content flow without blocking the event loop.
+    
+    Args:
+        topic: The topic to create content about
+    """
+    flow = LinkedInContentFlow()
+    flow.state.topic = topic
+    return await flow.kickoff_async()
+
+
+def _default_max_concurrency() -> int:
+    """OLLAMA_NUM_PARALLEL from the environment or .env, or DEFAULT_MAX_CONCURRENCY"""
+    load_dotenv()
+    try:
+        return max(1, int(os.getenv("OLLAMA_NUM_PARALLEL", DEFAULT_MAX_CONCURRENCY)))
+    except ValueError:
+        print(f"⚠️ Ignoring invalid OLLAMA_NUM_PARALLEL, using {DEFAULT_MAX_CONCURRENCY}")
+        return DEFAULT_MAX_CONCURRENCY
+
+
+async def akickoff_many(topics: List[str], max_concurrency: Optional[int] = None):
+    """
+    Run one LinkedIn content flow per topic concurrently.
+    
+    Args:
+        topics: Topics to create content about
+        max_concurrency: Maximum number of flows running at the same time
+            (defaults to OLLAMA_NUM_PARALLEL, or 4)
+        
+    Returns:
+        List of flow results in the same order as the topics
+    """
+    semaphore = asyncio.Semaphore(max_concurrency or _default_max_concurrency())
+
+    async def _run_one(topic: str):
+        async with semaphore:
+            return await akickoff(topic)
+
+    return await asyncio.gather(*(_run_one(topic) for topic in topics))
+
+
+def kickoff_many(topics: List[str], max_concurrency: Optional[int] = None):
+    """
+    Run the LinkedIn content flow for many topics in parallel.
+    
+    Args:
+        topics: Topics to create content about
+        max_concurrency: Maximum number of flows running at the same time
+    """
+    return asyncio.run(akickoff_many(topics, max_concurrency))
+
+
+def run():
+    """
+    Command line entry point: each argument is a topic.
+    
+    Several topics run as one batch in this process, so the CrewAI imports
+    and the LLM helper are set up once instead of once per topic.
+    """
+    topics = sys.argv[1:]
+    if len(topics) > 1:
+        return kickoff_many(topics)
+    if topics:
+        return kickoff(topics[0])
+    return kickoff()
+
+
 def plot():
     """
     Plot the LinkedIn content flow.
@@ -122,4 +231,4 @@ def plot():
 
 
 if __name__ == "__main__":
-    kickoff()
\ No newline at end of file
+    run()
\ No newline at end of file
@@ -3,15 +3,27 @@ Shared Helpers for CrewAI Multi-Flow System
 
 This package contains helper utilities that are shared across multiple CrewAI flows.
 Helpers provide common functionality for LLM management, knowledge storage, etc.
+
+The exports below are imported on first access, so helpers that do not need
+crewai (knowledge and output files) can be imported without it.
 """
 
-from .llm_helper import LLMHelper, create_llm
-from .knowledge_helper import KnowledgeHelper, store_web_results, check_topic_similarity
+import importlib
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    "LLMHelper": "llm_helper",
+    "create_llm": "llm_helper",
+    "get_llm_helper": "llm_helper",
+    "KnowledgeHelper": "knowledge_helper",
+    "store_web_results": "knowledge_helper",
+    "check_topic_similarity": "knowledge_helper",
+}
+
+__all__ = list(_EXPORTS)
+
 
-__all__ = [
-    "LLMHelper", 
-    "create_llm", 
-    "KnowledgeHelper", 
-    "store_web_results", 
-    "check_topic_similarity"
-]
\ No newline at end of file
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
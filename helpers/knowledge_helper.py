@@ -4,9 +4,46 @@ Manages web search results storage and article memory tracking using CrewAI know
 """
 import json
 import os
+import threading
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+# Number of web searches kept in the knowledge log
+MAX_STORED_SEARCHES = 50
+
+# Project root (this file lives in <root>/helpers), resolved once at import
+_PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values the stdlib json module does not handle natively"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _ensure_directories(project_root: Path) -> None:
+    """
+    Create the knowledge and output directories if they are missing
+    
+    Args:
+        project_root: Root directory of the project
+    """
+    # parents=True on the deepest paths creates output/ implicitly
+    for directory in (
+        project_root / "knowledge",
+        project_root / "output" / "articles",
+        project_root / "output" / "posts",
+    ):
+        directory.mkdir(parents=True, exist_ok=True)
 
 
 class KnowledgeHelper:
@@ -19,59 +56,218 @@ class KnowledgeHelper:
         Args:
             project_root: Root directory of the project (defaults to detected root)
         """
-        if project_root is None:
-            # Auto-detect project root - go up from helpers to project root
-            self.project_root = Path(__file__).parent.parent.parent.parent.parent
-        else:
-            self.project_root = Path(project_root)
+        self.project_root = Path(project_root) if project_root is not None else _PROJECT_ROOT
         
         self.knowledge_dir = self.project_root / "knowledge"
         self.output_dir = self.project_root / "output"
         
-        # Ensure directories exist
-        self.knowledge_dir.mkdir(exist_ok=True)
-        self.output_dir.mkdir(exist_ok=True)
-        (self.output_dir / "articles").mkdir(exist_ok=True)
-        (self.output_dir / "posts").mkdir(exist_ok=True)
-        
         # Knowledge files
-        self.web_results_file = self.knowledge_dir / "web_search_results.json"
+        self.web_results_file = self.knowledge_dir / "web_search_results.jsonl"
+        self.web_results_count_file = self.knowledge_dir / "web_search_results.count"
+        self.legacy_web_results_file = self.knowledge_dir / "web_search_results.json"
         self.article_memory_file = self.knowledge_dir / "article_memory.json"
         
-        # Initialize files if they don't exist
-        self._initialize_knowledge_files()
+        # Directories and files are created on first use
+        self._initialized = False
+        self._init_lock = threading.Lock()
+        
+        # Appends since the last compaction; read from the sidecar file once, then kept in memory
+        self._web_results_count: Optional[int] = None
+        self._web_results_lock = threading.Lock()
+        
+        # Parsed JSON files keyed by path, valid while (mtime_ns, size) is unchanged
+        self._load_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+        
+        # Tokenized article topics, rebuilt only when article_memory.json changes on disk
+        self._article_index: Tuple[Tuple[frozenset, Dict[str, Any]], ...] = ()
+        self._article_index_version: Optional[Tuple[int, int]] = None
+        # Inverted index: topic word -> positions of the articles using it
+        self._article_postings: Dict[str, List[int]] = {}
+    
+    def _ensure_initialized(self):
+        """Ensure the knowledge/output directories exist, and create the knowledge files once per helper"""
+        # Checked on every call (mkdir with exist_ok is cheap), so the helper
+        # keeps working if the directories are deleted while the process runs
+        _ensure_directories(self.project_root)
+        if self._initialized:
+            return
+        with self._init_lock:
+            if self._initialized:
+                return
+            # Initialize files if they don't exist
+            self._initialize_knowledge_files()
+            self._initialized = True
     
     def _initialize_knowledge_files(self):
         """Initialize knowledge files if they don't exist"""
-        if not self.web_results_file.exists():
-            self._save_json_file(self.web_results_file, {
-                "searches": [],
-                "last_updated": datetime.now().isoformat(),
-                "description": "Web search results storage for CrewAI knowledge system"
-            })
-        
-        if not self.article_memory_file.exists():
-            self._save_json_file(self.article_memory_file, {
-                "articles": [],
-                "topics_covered": [],
-                "last_updated": datetime.now().isoformat(),
-                "description": "Article memory tracking to prevent topic repetition"
-            })
+        if not self.web_results_file.exists() and self.legacy_web_results_file.exists():
+            self._migrate_legacy_web_results()
+        
+        self._save_json_file(self.article_memory_file, {
+            "articles": [],
+            "topics_covered": [],
+            "last_updated": datetime.now(),
+            "description": "Article memory tracking to prevent topic repetition"
+        }, exclusive=True)
     
-    def _save_json_file(self, file_path: Path, data: Dict[str, Any]):
-        """Save data to JSON file safely"""
+    def _save_json_file(self, file_path: Path, data: Dict[str, Any], exclusive: bool = False):
+        """
+        Save data to JSON file safely
+        
+        Args:
+            file_path: File to write
+            data: JSON-serializable data
+            exclusive: Only create the file; leave an existing file untouched
+        """
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                payload = orjson.dumps(
+                    data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_DATACLASS
+                )
+            else:
+                payload = json.dumps(data, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+            # 'xb' fails atomically if the file exists: no separate exists() check, no race
+            with open(file_path, 'xb' if exclusive else 'wb') as f:
+                f.write(payload)
+            self._load_cache.pop(file_path, None)
+        except FileExistsError:
+            pass
         except Exception as e:
             print(f"Error saving {file_path}: {e}")
     
+    def _dumps_line(self, data: Dict[str, Any]) -> bytes:
+        """Serialize one record as a single JSONL line"""
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_DATACLASS) + b"\n"
+        return (json.dumps(data, ensure_ascii=False, default=_json_default) + "\n").encode("utf-8")
+
+    def _loads_line(self, line: bytes) -> Dict[str, Any]:
+        """Parse one JSONL line"""
+        if orjson is not None:
+            return orjson.loads(line)
+        return json.loads(line)
+
+    def _migrate_legacy_web_results(self):
+        """Convert the old single-document web_search_results.json into the JSONL log"""
+        # Parsed directly rather than through _load_json_file, which returns {} for a
+        # corrupt file: the legacy file is deleted below, so it must have been read in full
+        try:
+            raw = self.legacy_web_results_file.read_bytes()
+            legacy = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            searches = legacy.get("searches", [])[-MAX_STORED_SEARCHES:]
+        except Exception as e:
+            print(f"Not migrating unreadable {self.legacy_web_results_file}, leaving it in place: {e}")
+            return
+        try:
+            with open(self.web_results_file, 'wb') as f:
+                f.writelines(self._dumps_line(entry) for entry in searches)
+            self.web_results_count_file.write_text(str(len(searches)))
+            self.legacy_web_results_file.unlink()
+        except Exception as e:
+            print(f"Error migrating {self.legacy_web_results_file}: {e}")
+
+    def _increment_web_results_count(self) -> int:
+        """Bump the number of searches appended to the log and return the new value"""
+        if self._web_results_count is None:
+            try:
+                self._web_results_count = int(self.web_results_count_file.read_text())
+            except (FileNotFoundError, ValueError):
+                self._web_results_count = 0
+        self._web_results_count += 1
+        self.web_results_count_file.write_text(str(self._web_results_count))
+        return self._web_results_count
+
+    def _compact_web_results(self):
+        """Rewrite the log so it only holds the most recent searches"""
+        with open(self.web_results_file, 'rb') as f:
+            recent = deque(f, maxlen=MAX_STORED_SEARCHES)
+        tmp_path = self.web_results_file.with_suffix(".jsonl.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.writelines(recent)
+        os.replace(tmp_path, self.web_results_file)
+
+    def read_recent_web_results(self, n: int = MAX_STORED_SEARCHES) -> List[Dict[str, Any]]:
+        """
+        Read the most recent stored web searches
+        
+        Args:
+            n: Maximum number of searches to return
+            
+        Returns:
+            List of search entries, oldest first
+        """
+        self._ensure_initialized()
+        if n <= 0:
+            return []
+        try:
+            with open(self.web_results_file, 'rb') as f:
+                lines = deque(f, maxlen=n)
+            return [self._loads_line(line) for line in lines if line.strip()]
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            print(f"Error loading {self.web_results_file}: {e}")
+            return []
+    
+    def article_topic_index(self) -> Tuple[Tuple[frozenset, Dict[str, Any]], ...]:
+        """
+        Get the stored articles paired with their topic word sets
+        
+        The article memory is parsed and tokenized once, then reused until
+        the file's modification time or size changes.
+        
+        Returns:
+            Tuple of (topic words, article) pairs
+        """
+        try:
+            st = self.article_memory_file.stat()
+        except FileNotFoundError:
+            return ()
+        version = (st.st_mtime_ns, st.st_size)
+        if version != self._article_index_version:
+            articles = self._load_json_file(self.article_memory_file).get("articles", [])
+            self._article_index = tuple(
+                (_topic_words(article.get("topic", "")), article) for article in articles
+            )
+            self._article_postings = {}
+            for position, (words, _) in enumerate(self._article_index):
+                for word in words:
+                    self._article_postings.setdefault(word, []).append(position)
+            self._article_index_version = version
+        return self._article_index
+    
+    def articles_sharing_words(self, words: frozenset) -> List[Tuple[frozenset, Dict[str, Any]]]:
+        """
+        Get the stored articles whose topic shares at least one word with the given set
+        
+        Args:
+            words: Lower-cased topic words
+            
+        Returns:
+            List of (topic words, article) pairs, in stored order
+        """
+        article_index = self.article_topic_index()
+        positions = set()
+        for word in words:
+            positions.update(self._article_postings.get(word, ()))
+        return [article_index[position] for position in sorted(positions)]
+    
     def _load_json_file(self, file_path: Path) -> Dict[str, Any]:
-        """Load data from JSON file safely"""
+        """Load data from JSON file safely, re-parsing only when the file changed"""
         try:
-            if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            st = file_path.stat()
+            version = (st.st_mtime_ns, st.st_size)
+            cached = self._load_cache.get(file_path)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+            
+            raw = file_path.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            self._load_cache[file_path] = (version, data)
+            return data
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Error loading {file_path}: {e}")
         return {}
@@ -90,31 +286,26 @@ class KnowledgeHelper:
             True if stored successfully
         """
         try:
-            # Load existing data
-            data = self._load_json_file(self.web_results_file)
+            self._ensure_initialized()
             
             # Create new search entry
             search_entry = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": datetime.now(),
                 "query": search_query,
                 "topic": task_topic,
                 "results_count": len(results),
                 "results": results
             }
             
-            # Add to searches list
-            if "searches" not in data:
-                data["searches"] = []
-            
-            data["searches"].append(search_entry)
-            data["last_updated"] = datetime.now().isoformat()
-            
-            # Keep only last 50 searches to prevent file bloat
-            if len(data["searches"]) > 50:
-                data["searches"] = data["searches"][-50:]
-            
-            # Save updated data
-            self._save_json_file(self.web_results_file, data)
+            line = self._dumps_line(search_entry)
+            with self._web_results_lock:
+                # Append a single line instead of rewriting the whole history
+                with open(self.web_results_file, 'ab') as f:
+                    f.write(line)
+                
+                # Trim back to the last 50 searches once every 50 appends to prevent file bloat
+                if self._increment_web_results_count() % MAX_STORED_SEARCHES == 0:
+                    self._compact_web_results()
             
             print(f"📚 Stored web search results: '{search_query}' ({len(results)} results)")
             return True
@@ -124,6 +315,26 @@ class KnowledgeHelper:
             return False
 
 
+@lru_cache(maxsize=1024)
+def _topic_words(topic: str) -> frozenset:
+    """Lower-cased word set of a topic, cached so stored topics are tokenized once"""
+    return frozenset(topic.lower().split())
+
+
+@lru_cache(maxsize=None)
+def _get_helper(project_root: Optional[str] = None) -> KnowledgeHelper:
+    """
+    Get the shared KnowledgeHelper for a project root
+    
+    Args:
+        project_root: Root directory of the project (defaults to detected root)
+        
+    Returns:
+        Cached KnowledgeHelper instance
+    """
+    return KnowledgeHelper(project_root)
+
+
 # Convenience function for use by tools
 def store_web_results(search_query: str, results: List[Dict[str, Any]], task_topic: str = "") -> bool:
     """
@@ -137,7 +348,7 @@ def store_web_results(search_query: str, results: List[Dict[str, Any]], task_top
     Returns:
         True if stored successfully
     """
-    helper = KnowledgeHelper()
+    helper = _get_helper()
     return helper.store_web_search_results(search_query, results, task_topic)
 
 
@@ -152,13 +363,13 @@ def check_topic_similarity(topic: str, threshold: float = 0.8) -> Dict[str, Any]
     Returns:
         Dictionary with similarity results and recommendations
     """
-    helper = KnowledgeHelper()
+    helper = _get_helper()
     
     try:
-        # Load article memory
-        article_memory = helper._load_json_file(helper.article_memory_file)
+        # Load the tokenized article memory (re-parsed only when the file changes)
+        article_index = helper.article_topic_index()
         
-        if not article_memory.get("articles", []):
+        if not article_index:
             return {
                 "is_similar": False,
                 "similarity_score": 0.0,
@@ -168,12 +379,14 @@ def check_topic_similarity(topic: str, threshold: float = 0.8) -> Dict[str, Any]
         
         # Simple keyword-based similarity for now
         # In a real implementation, you might use embeddings/vector similarity
-        topic_words = set(topic.lower().split())
+        topic_words = _topic_words(topic)
         similar_articles = []
         
-        for article in article_memory["articles"]:
-            article_words = set(article["topic"].lower().split())
-            common_words = topic_words.intersection(article_words)
+        # Only articles sharing a word can reach a positive threshold, so skip the rest via the
+        # inverted index; a threshold of 0 or less matches every article, so scan them all
+        candidates = helper.articles_sharing_words(topic_words) if threshold > 0 else article_index
+        for article_words, article in candidates:
+            common_words = topic_words & article_words
             similarity = len(common_words) / max(len(topic_words), len(article_words))
             
             if similarity >= threshold:
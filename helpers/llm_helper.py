@@ -4,15 +4,35 @@ Provides utilities for configuring and managing LLM instances (Ollama, OpenAI, a
 """
 import yaml
 import os
+import asyncio
+import json
+import hashlib
 import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from crewai import LLM
-from typing import Dict, Any, Optional, List, Union
-from dataclasses import dataclass
-from dotenv import load_dotenv
+from typing import TYPE_CHECKING, Dict, Any, ClassVar, Literal, Optional, List, Tuple, Union
+from dataclasses import asdict, dataclass
 
-# Load environment variables from .env file
-load_dotenv()
+if TYPE_CHECKING:
+    import httpx
+    import requests
+
+# Prefer the libyaml-backed loader when available (much faster than the pure-Python one)
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
+# orjson is optional; it serializes cache keys several times faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -25,12 +45,73 @@ DEFAULT_TEMPERATURE = 0.5
 DEFAULT_MAX_TOKENS_OPENAI = 2000
 DEFAULT_REQUEST_TIMEOUT = 10
 CONNECTION_TIMEOUT = 5
+WARMUP_TIMEOUT = 30
+# Seconds an Ollama reachability check result is reused
+CONNECTION_CHECK_TTL = 30
+FAST_TIER_CONTEXT_LENGTH = 4096
+WARMUP_KEEP_ALIVE = "1h"
+MAX_PRELOAD_WORKERS = 4
+DEFAULT_CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "agents.yaml"
+DEFAULT_RESPONSE_CACHE_DIR = Path.home() / ".cache" / "crewai_llm_cache"
+DEFAULT_CONFIG_CACHE_DIR = Path.home() / ".cache" / "crewai_config_cache"
 
 # Model families for detection
 OPENAI_MODEL_PREFIXES = ('gpt-', 'o1-')
-OPENAI_MODEL_NAMES = ('gpt-4o', 'gpt-4o-mini')
+OPENAI_MODEL_NAMES = frozenset({'gpt-4o', 'gpt-4o-mini'})
 GITHUB_MODEL_PREFIXES = ('github/',)
 
+# One anchored match classifies a model name; the matching group names the provider
+_PROVIDER_RE = re.compile(
+    "^(?:(?P<openai>{})|(?P<github>{}))".format(
+        "|".join(map(re.escape, OPENAI_MODEL_PREFIXES)),
+        "|".join(map(re.escape, GITHUB_MODEL_PREFIXES))
+    )
+)
+
+# Model-specific context optimizations for memory efficiency
+_CONTEXT_MAP: Dict[str, int] = {
+    # Small models (1.7B and below) - use smaller context to prevent OOM
+    'qwen2.5:0.5b': 4096,
+    'qwen2.5:1.5b': 4096,
+    'qwen2.5:3b': 6144,
+    'qwen3:1.7b': 4096,  # Reduced from 14746 to prevent OOM
+    'phi3.5:3.8b': 4096,
+    'llama3.2:1b': 4096,
+    'gemma2:2b': 4096,
+    # Medium models (7B range)
+    'openhermes:v2.5': 6144,
+    'mistral:7b': 6144,
+    'llama3.2:3b': 6144,
+    'llama3.1:7b': 6144,
+    # Larger models - keep higher context but still reasonable
+    'llama3.1:13b': 8192,
+    'llama3.1:70b': 8192,
+}
+
+# Family defaults for model tags not listed above (checked in order)
+_CONTEXT_PREFIX_MAP = (
+    ('llama3.1:', 6144),
+    ('mistral:', 6144),
+    ('openhermes:', 6144),
+    ('qwen2.5:', 4096),
+    ('qwen3:', 4096),
+    ('llama3.2:', 4096),
+    ('phi3.5:', 4096),
+    ('gemma2:', 4096),
+)
+
+
+def _available_cpu_count() -> int:
+    """CPUs this process may run on; respects cpuset limits in containers where supported"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on Windows/macOS
+        return os.cpu_count() or 4
+
+
+# Use half the available CPU cores for better system responsiveness (computed once)
+_OPTIMAL_THREADS = max(2, min(8, _available_cpu_count() // 2))
+
 # GitHub Copilot available models
 GITHUB_AVAILABLE_MODELS = (
     'gpt-4o',
@@ -42,6 +123,111 @@ GITHUB_AVAILABLE_MODELS = (
 )
 
 
+@lru_cache(maxsize=64)
+def _detect_provider(model_name: str) -> Literal["openai", "github", "ollama"]:
+    """Return the provider ('openai', 'github' or 'ollama') serving a model name"""
+    if model_name in OPENAI_MODEL_NAMES:
+        return "openai"
+    match = _PROVIDER_RE.match(model_name)
+    return match.lastgroup if match else "ollama"
+
+
+@lru_cache(maxsize=64)
+def _optimal_context_length(model_name: str) -> int:
+    """Resolve the context length for a model name (exact size, then model family, then default)"""
+    exact = _CONTEXT_MAP.get(model_name)
+    if exact is not None:
+        return exact
+
+    # Unlisted sizes fall back to their model family, then to a safe default
+    return next(
+        (length for prefix, length in _CONTEXT_PREFIX_MAP if model_name.startswith(prefix)),
+        4096
+    )
+
+
+# Keep-alive session for Ollama control-plane calls (warm-up, status, unload),
+# so consecutive calls reuse one connection instead of reconnecting each time.
+# Created on first use so importing this module doesn't import requests.
+_OLLAMA_SESSION: Optional["requests.Session"] = None
+_OLLAMA_SESSION_LOCK = threading.Lock()
+
+
+def _ollama_session() -> "requests.Session":
+    """Get the shared keep-alive session for Ollama requests"""
+    global _OLLAMA_SESSION
+    if _OLLAMA_SESSION is None:
+        with _OLLAMA_SESSION_LOCK:
+            if _OLLAMA_SESSION is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                session = requests.Session()
+                session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+                session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+                _OLLAMA_SESSION = session
+    return _OLLAMA_SESSION
+
+
+# Parsed YAML per resolved path, tagged with the (mtime_ns, size) it was parsed from
+_YAML_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def _config_sidecar_path(key: str) -> Path:
+    """JSON sidecar holding the parsed form of a config file, outside the source tree"""
+    return DEFAULT_CONFIG_CACHE_DIR / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]}.json"
+
+
+def _read_config_sidecar(key: str, version: Tuple[int, int]) -> Any:
+    """Return the parsed config stored by a previous run, or None if missing or stale"""
+    try:
+        raw = _config_sidecar_path(key).read_bytes()
+        document = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (OSError, ValueError):
+        return None
+    if document.get("version") != list(version):
+        return None
+    return document.get("config")
+
+
+def _write_config_sidecar(key: str, version: Tuple[int, int], data: Any) -> None:
+    """Store the parsed config so the next process can skip YAML parsing (best effort)"""
+    document = {"version": list(version), "config": data}
+    sidecar_path = _config_sidecar_path(key)
+    try:
+        raw = orjson.dumps(document) if orjson is not None else json.dumps(document).encode('utf-8')
+        sidecar_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = sidecar_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(raw)
+        os.replace(tmp_path, sidecar_path)
+    except (OSError, TypeError, ValueError) as e:
+        # Values JSON can't represent (e.g. YAML dates) just mean no sidecar
+        logger.debug(f"Could not write config sidecar for {key}: {e}")
+
+
+def _load_yaml(path: Path) -> Any:
+    """
+    Parse a YAML file once per process, re-parsing only when its mtime or size changes
+
+    Across processes the parsed form is reused from a JSON sidecar in the
+    user cache directory, so YAML is only parsed after the file is edited.
+    """
+    stat = path.stat()
+    version = (stat.st_mtime_ns, stat.st_size)
+    key = str(path.resolve())
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    data = _read_config_sidecar(key, version)
+    if data is None:
+        # One contiguous bytes buffer lets libyaml parse without chunked Python-level reads
+        data = yaml.load(path.read_bytes(), Loader=YamlSafeLoader)
+        if data is not None:
+            _write_config_sidecar(key, version, data)
+    _YAML_CACHE[key] = (version, data)
+    return data
+
+
 @dataclass
 class MemoryOptimizationConfig:
     """Configuration for memory optimization settings"""
@@ -66,9 +252,144 @@ class ModelOptions:
     numa: bool = False
 
 
+# Default Ollama options; each LLM gets a copy with its per-agent fields patched in
+_OLLAMA_BASE_OPTIONS = asdict(ModelOptions(num_thread=_OPTIMAL_THREADS))
+
+
+class ResponseCache:
+    """Content-hash cache for LLM completions, kept in memory and persisted one file per key"""
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None):
+        """
+        Initialize the response cache
+
+        Args:
+            cache_dir: Directory for persisted responses (defaults to ~/.cache/crewai_llm_cache)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_RESPONSE_CACHE_DIR
+        self._memory: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def normalize_messages(messages: Any) -> Any:
+        """
+        Collapse whitespace in prompt text, so prompts differing only in
+        indentation, line wrapping or trailing spaces share a cache entry
+
+        Args:
+            messages: Prompt string or list of chat messages
+
+        Returns:
+            Messages with normalized text content
+        """
+        if isinstance(messages, str):
+            return " ".join(messages.split())
+        if isinstance(messages, list):
+            return [
+                {**message, "content": " ".join(message["content"].split())}
+                if isinstance(message, dict) and isinstance(message.get("content"), str)
+                else message
+                for message in messages
+            ]
+        return messages
+
+    @classmethod
+    def make_key(cls, model: str, messages: Any, temperature: Optional[float], tools: Any = None) -> str:
+        """Build a stable sha256 key from everything that influences the completion"""
+        payload = {
+            "model": model,
+            "messages": cls.normalize_messages(messages),
+            "temperature": temperature,
+            "tools": tools
+        }
+        if orjson is not None:
+            serialized = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS, default=str)
+        else:
+            serialized = json.dumps(payload, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.sha256(serialized).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for a key, or None on a miss"""
+        with self._lock:
+            if key in self._memory:
+                self.hits += 1
+                return self._memory[key]
+
+        file_path = self.cache_dir / f"{key}.txt"
+        try:
+            response = file_path.read_text(encoding='utf-8')
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self._memory[key] = response
+            self.hits += 1
+        return response
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response in memory and on disk (atomic replace)"""
+        with self._lock:
+            self._memory[key] = response
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_dir / f"{key}.{threading.get_ident()}.tmp"
+            tmp_path.write_text(response, encoding='utf-8')
+            os.replace(tmp_path, self.cache_dir / f"{key}.txt")
+        except OSError as e:
+            logger.warning(f"Could not persist LLM response cache entry: {e}")
+
+    def clear(self) -> None:
+        """Remove all cached responses"""
+        with self._lock:
+            self._memory.clear()
+            self.hits = 0
+            self.misses = 0
+        if self.cache_dir.exists():
+            for file_path in self.cache_dir.glob("*.txt"):
+                file_path.unlink(missing_ok=True)
+
+
+class CachingLLM(LLM):
+    """LLM that returns cached completions for identical requests instead of calling the provider"""
+
+    response_cache: Optional[ResponseCache] = None
+
+    def call(self, messages, tools=None, *args, **kwargs):
+        """Return a cached completion on a hit, otherwise call the provider and cache the text result"""
+        cache = self.response_cache
+        if cache is None:
+            return super().call(messages, tools, *args, **kwargs)
+
+        key = cache.make_key(self.model, messages, getattr(self, 'temperature', None), tools)
+        cached = cache.get(key)
+        if cached is not None:
+            logger.debug(f"LLM response cache hit for {self.model}")
+            return cached
+
+        response = super().call(messages, tools, *args, **kwargs)
+        if isinstance(response, str) and response.strip():
+            cache.set(key, response)
+        return response
+
+
 class LLMHelper:
     """Helper class for managing LLM configurations (Ollama and OpenAI) with memory optimization"""
 
+    # LLM instances shared by every helper, keyed by (config path, agent name, helper build settings)
+    _llm_cache: ClassVar[Dict[Tuple[str, str, Tuple], LLM]] = {}
+    # Distinct LLM objects, keyed by their constructor settings, so agents with identical settings share one
+    _llm_instances: ClassVar[Dict[Tuple[str, Optional[str]], LLM]] = {}
+    _cache_lock: ClassVar[threading.RLock] = threading.RLock()
+    # Parsed config each config path's cached instances were built from
+    _cache_sources: ClassVar[Dict[str, Any]] = {}
+    _dotenv_loaded: ClassVar[bool] = False
+    # Monotonic time of the last successful Ollama reachability check per base URL
+    _connection_checks: ClassVar[Dict[str, float]] = {}
+
     def __init__(self, config_path: Optional[Union[str, Path]] = None):
         """
         Initialize the LLM helper
@@ -76,23 +397,50 @@ class LLMHelper:
         Args:
             config_path: Path to the agents.yaml config file
         """
+        self._load_dotenv_once()
+
         if config_path is None:
             # Default path relative to this file - go up, then to config
-            self.config_path = Path(__file__).parent.parent / "config" / "agents.yaml"
+            self.config_path = DEFAULT_CONFIG_PATH
         else:
             self.config_path = Path(config_path)
 
         self.ollama_base_url = DEFAULT_OLLAMA_BASE_URL
         self.github_base_url = DEFAULT_GITHUB_MODELS_BASE_URL
         self._agents_config: Optional[Dict[str, Any]] = None
-        # Removed _llm_cache - no caching for simpler behavior
+        # Agent -> model mapping, with the config object it was derived from
+        self._available_models: Optional[Tuple[Dict[str, Any], Dict[str, str]]] = None
 
         # Set API keys from environment
         self.openai_api_key = os.getenv('OPENAI_API_KEY')
         self.github_token = os.getenv('GITHUB_TOKEN')
 
+        # Opt-in response cache: identical prompts are answered from disk on re-runs.
+        # Only temperature-0 LLMs use it, unless sampled responses are opted in too.
+        self.response_cache: Optional[ResponseCache] = None
+        if os.getenv('LLM_RESPONSE_CACHE', '').lower() in ('1', 'true', 'yes'):
+            self.response_cache = ResponseCache(os.getenv('LLM_RESPONSE_CACHE_DIR'))
+        self.cache_sampled_responses = os.getenv('LLM_RESPONSE_CACHE_SAMPLED', '').lower() in ('1', 'true', 'yes')
+
         # Memory optimization settings for 12GB GPU
         self.memory_optimization = MemoryOptimizationConfig()
+
+        # Start loading configured Ollama models while the crew is still being set up
+        self.warmup_ollama_models()
+
+        # Build and validate every agent's LLM up front, so a misconfigured agent
+        # is reported before the crew runs; opt out with LLM_PRELOAD=0
+        if os.getenv('LLM_PRELOAD', '').lower() not in ('0', 'false', 'no'):
+            self.preload_llm_instances()
+    
+    @classmethod
+    def _load_dotenv_once(cls) -> None:
+        """Load environment variables from the .env file the first time a helper is created"""
+        if cls._dotenv_loaded:
+            return
+        from dotenv import load_dotenv
+        load_dotenv()
+        cls._dotenv_loaded = True
     
     def load_agents_config(self) -> Dict[str, Any]:
         """
@@ -106,30 +454,40 @@ class LLMHelper:
             ValueError: If the YAML is malformed
             RuntimeError: If the config is empty or invalid
         """
-        if self._agents_config is None:
+        try:
             try:
-                if not self.config_path.exists():
-                    raise FileNotFoundError(f"Agents config file not found: {self.config_path}")
+                config = _load_yaml(self.config_path)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Agents config file not found: {self.config_path}")
+
+            # Unchanged on disk since the last load - nothing to validate
+            if config is self._agents_config:
+                return config
 
-                with open(self.config_path, 'r', encoding='utf-8') as file:
-                    config = yaml.safe_load(file)
+            if not config:
+                raise RuntimeError(f"Config file is empty: {self.config_path}")
 
-                if not config:
-                    raise RuntimeError(f"Config file is empty: {self.config_path}")
+            if not isinstance(config, dict):
+                raise RuntimeError(f"Config file must contain a dictionary at root level: {self.config_path}")
 
-                if not isinstance(config, dict):
-                    raise RuntimeError(f"Config file must contain a dictionary at root level: {self.config_path}")
+            # Validate that config has expected structure
+            self._validate_config_structure(config)
 
-                # Validate that config has expected structure
-                self._validate_config_structure(config)
+            # Config was edited: LLM instances built from the old one are stale,
+            # including those cached by other helpers for the same file
+            with self._cache_lock:
+                previous = self._cache_sources.get(str(self.config_path))
+                self._cache_sources[str(self.config_path)] = config
+            if previous is not None and previous is not config:
+                self._clear_config_cache()
 
-                self._agents_config = config
-                logger.debug(f"Successfully loaded agents config from {self.config_path}")
+            self._agents_config = config
+            logger.debug(f"Successfully loaded agents config from {self.config_path}")
 
-            except yaml.YAMLError as e:
-                raise ValueError(f"Error parsing agents.yaml: {e}")
-            except Exception as e:
-                raise RuntimeError(f"Unexpected error loading config: {e}")
+        except yaml.YAMLError as e:
+            raise ValueError(f"Error parsing agents.yaml: {e}")
+        except Exception as e:
+            raise RuntimeError(f"Unexpected error loading config: {e}")
 
         return self._agents_config
 
@@ -183,9 +541,10 @@ class LLMHelper:
         if 'llm' not in agent_config:
             raise ValueError(f"No LLM specified for agent '{agent_name}'")
         
-        model_name = agent_config['llm']
-        
-        # Auto-upgrade to GitHub Copilot if model is available and we have a token
+        return self._upgrade_to_github(agent_config['llm'])
+    
+    def _upgrade_to_github(self, model_name: str) -> str:
+        """Auto-upgrade to GitHub Copilot if the model is available there and we have a token"""
         if (model_name in GITHUB_AVAILABLE_MODELS and 
             not model_name.startswith('github/') and 
             self.github_token):
@@ -209,32 +568,149 @@ class LLMHelper:
             RuntimeError: If LLM creation fails
         """
         try:
-            model_name = self.get_llm_model_name(agent_name)
-            thinking_enabled = self.get_thinking_parameter(agent_name)
-
-            # Determine provider and create appropriate LLM instance
-            if self._is_openai_model(model_name):
-                llm_instance = self._create_openai_llm(model_name, agent_name)
-            elif self._is_github_model(model_name):
-                llm_instance = self._create_github_llm(model_name, agent_name)
-            else:
-                llm_instance = self._create_ollama_llm(model_name, agent_name, thinking_enabled)
-
-            logger.info(f"Created LLM instance for agent '{agent_name}': {model_name}")
-            return llm_instance
-
+            return self._build_agent_llm(agent_name)
         except Exception as e:
             logger.error(f"Failed to create LLM instance for agent '{agent_name}': {e}")
             raise RuntimeError(f"Failed to create LLM instance for agent '{agent_name}': {e}") from e
 
+    def _build_agent_llm(self, agent_name: str) -> LLM:
+        """Create (or fetch the cached) LLM for an agent, raising on invalid configuration without logging"""
+        # Reloads (and drops cached instances) only if agents.yaml changed on disk
+        config = self.load_agents_config()
+
+        cache_key = (str(self.config_path), agent_name, self._build_settings())
+        cached_instance = self._llm_cache.get(cache_key)
+        if cached_instance is not None:
+            return cached_instance
+
+        # Resolve model, thinking and tier from a single lookup of the agent's config
+        agent_config = config.get(agent_name)
+        if agent_config is None:
+            raise ValueError(f"Agent '{agent_name}' not found in configuration")
+        if 'llm' not in agent_config:
+            raise ValueError(f"No LLM specified for agent '{agent_name}'")
+
+        model_name = self._upgrade_to_github(agent_config['llm'])
+        thinking_enabled = agent_config.get('thinking', True)
+
+        # Determine provider and create appropriate LLM instance
+        provider = _detect_provider(model_name)
+        if provider == "openai":
+            llm_instance = self._create_openai_llm(model_name, agent_name)
+        elif provider == "github":
+            llm_instance = self._create_github_llm(model_name, agent_name)
+        else:
+            llm_instance = self._create_ollama_llm(
+                model_name, agent_name, thinking_enabled,
+                fast_model=agent_config.get('fast_llm')
+            )
+
+        with self._cache_lock:
+            llm_instance = self._llm_cache.setdefault(cache_key, llm_instance)
+
+        logger.info(f"Created LLM instance for agent '{agent_name}': {model_name}")
+        return llm_instance
+
+    def _build_settings(self) -> Tuple:
+        """
+        Helper state that changes the LLM built for an agent, beyond the agent's config
+
+        Part of the instance cache key, so a helper with other credentials, endpoints
+        or response cache settings never receives an instance built by another helper.
+        """
+        return (
+            self.ollama_base_url,
+            self.github_base_url,
+            self.openai_api_key,
+            self.github_token,
+            str(self.response_cache.cache_dir) if self.response_cache is not None else None,
+            self.cache_sampled_responses
+        )
+
+    def preload_llm_instances(self) -> Dict[str, str]:
+        """
+        Create and cache the LLM instance of every configured agent up front
+
+        Runs on helper creation unless LLM_PRELOAD=0, or when called explicitly.
+        Each failure is logged as a warning naming the agent and returned rather
+        than raised, so agents that the current run does not use do not block it.
+
+        Returns:
+            Dictionary mapping agent names that failed to their error message
+        """
+        try:
+            config = self.load_agents_config()
+        except Exception as e:
+            logger.debug(f"Skipping LLM preload, config not loadable: {e}")
+            return {}
+
+        agent_names = [name for name, agent_config in config.items() if isinstance(agent_config, dict)]
+        if not agent_names:
+            return {}
+
+        # Agents are independent, so their LLMs are built concurrently
+        failures = {}
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_PRELOAD_WORKERS, len(agent_names)),
+            thread_name_prefix="llm-preload"
+        ) as executor:
+            futures = {
+                agent_name: executor.submit(self._build_agent_llm, agent_name)
+                for agent_name in agent_names
+            }
+            for agent_name, future in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    failures[agent_name] = str(e)
+
+        for agent_name, error in failures.items():
+            logger.warning(f"LLM for agent '{agent_name}' in {self.config_path} is misconfigured: {error}")
+        return failures
+
+    def _build_llm(self, llm_params: Dict[str, Any]) -> LLM:
+        """Create the LLM (wrapped with the response cache when it applies), reusing an identical one"""
+        response_cache = self._response_cache_for(llm_params)
+        instance_key = (
+            json.dumps(llm_params, sort_keys=True),
+            str(response_cache.cache_dir) if response_cache is not None else None
+        )
+        cached_instance = self._llm_instances.get(instance_key)
+        if cached_instance is not None:
+            return cached_instance
+
+        if response_cache is None:
+            llm_instance = LLM(**llm_params)
+        else:
+            llm_instance = CachingLLM(**llm_params)
+            llm_instance.response_cache = response_cache
+
+        with self._cache_lock:
+            return self._llm_instances.setdefault(instance_key, llm_instance)
+
+    def _response_cache_for(self, llm_params: Dict[str, Any]) -> Optional[ResponseCache]:
+        """
+        Response cache for an LLM with these settings, if its responses may be replayed
+
+        Only deterministic (temperature 0) completions are cached by default; replaying
+        a sampled completion forever would hide the variation the temperature asks for.
+        LLM_RESPONSE_CACHE_SAMPLED=1 caches sampled completions as well.
+        """
+        if self.response_cache is None or self.cache_sampled_responses:
+            return self.response_cache
+        temperature = llm_params.get("temperature")
+        if temperature is None:
+            # Ollama models carry their sampling settings in the model options
+            temperature = llm_params.get("model_kwargs", {}).get("options", {}).get("temperature")
+        return self.response_cache if temperature == 0 else None
+
     def _is_openai_model(self, model_name: str) -> bool:
         """Check if the model is an OpenAI model"""
-        return (model_name.startswith(OPENAI_MODEL_PREFIXES) or
-                model_name in OPENAI_MODEL_NAMES)
+        return _detect_provider(model_name) == "openai"
 
     def _is_github_model(self, model_name: str) -> bool:
         """Check if the model is a GitHub Models model"""
-        return model_name.startswith(GITHUB_MODEL_PREFIXES)
+        return _detect_provider(model_name) == "github"
 
     def _create_openai_llm(self, model_name: str, agent_name: str) -> LLM:
         """Create an OpenAI LLM instance"""
@@ -249,7 +725,7 @@ class LLMHelper:
             "max_tokens": DEFAULT_MAX_TOKENS_OPENAI
         }
 
-        return LLM(**llm_params)
+        return self._build_llm(llm_params)
 
     def _create_github_llm(self, model_name: str, agent_name: str) -> LLM:
         """Create a GitHub Models LLM instance"""
@@ -267,26 +743,35 @@ class LLMHelper:
             "max_tokens": DEFAULT_MAX_TOKENS_OPENAI
         }
 
-        return LLM(**llm_params)
+        return self._build_llm(llm_params)
+
+    def _create_ollama_llm(self, model_name: str, agent_name: str, thinking_enabled: bool,
+                           fast_model: Optional[str] = None) -> LLM:
+        """
+        Create an Ollama LLM instance
+
+        Ollama agents with a `fast_llm:` model (e.g. summarizing or research roles)
+        run on that small quantized model with a reduced context window, which
+        roughly doubles tokens/sec. Agents on GitHub/OpenAI models ignore `fast_llm`.
+        """
+        num_ctx = self.get_optimal_context_length(model_name)
+        if fast_model:
+            logger.info(f"Routing fast agent '{agent_name}' from '{model_name}' to '{fast_model}'")
+            model_name = fast_model
+            num_ctx = min(num_ctx, FAST_TIER_CONTEXT_LENGTH)
 
-    def _create_ollama_llm(self, model_name: str, agent_name: str, thinking_enabled: bool) -> LLM:
-        """Create an Ollama LLM instance"""
         llm_params = {
             "model": f"ollama/{model_name}",
             "base_url": self.ollama_base_url,
         }
 
-        # Configure model options
-        model_options = ModelOptions(
-            think=thinking_enabled,
-            num_ctx=self.get_optimal_context_length(model_name),
-            num_thread=self.get_optimal_thread_count()
-        )
+        # Configure model options (a fresh dict per instance, so LLMs never share one)
+        model_options = _OLLAMA_BASE_OPTIONS.copy()
+        model_options.update(think=thinking_enabled, num_ctx=num_ctx)
 
-        # Convert to dictionary for CrewAI
-        llm_params["model_kwargs"] = {"options": model_options.__dict__}
+        llm_params["model_kwargs"] = {"options": model_options}
 
-        return LLM(**llm_params)
+        return self._build_llm(llm_params)
     
     def get_thinking_parameter(self, agent_name: str) -> bool:
         """
@@ -305,6 +790,25 @@ class LLMHelper:
         
         agent_config = config[agent_name]
         return agent_config.get('thinking', True)  # Default to True if not specified
+
+    def get_fast_model_name(self, agent_name: str) -> Optional[str]:
+        """
+        Get the fast Ollama model configured for a specific agent
+
+        Args:
+            agent_name: Name of the agent
+
+        Returns:
+            The agent's `fast_llm` model when its `llm` runs on Ollama, otherwise None
+        """
+        config = self.load_agents_config()
+
+        if agent_name not in config:
+            raise ValueError(f"Agent '{agent_name}' not found in configuration")
+
+        if _detect_provider(self.get_llm_model_name(agent_name)) != "ollama":
+            return None
+        return config[agent_name].get('fast_llm')
     
     def get_optimal_context_length(self, model_name: str) -> int:
         """
@@ -317,28 +821,7 @@ class LLMHelper:
         Returns:
             Optimal context length
         """
-        # Model-specific context optimizations for memory efficiency
-        context_map = {
-            # Small models (1.7B and below) - use smaller context to prevent OOM
-            'qwen2.5:0.5b': 4096,
-            'qwen2.5:1.5b': 4096,
-            'qwen2.5:3b': 6144,
-            'qwen3:1.7b': 4096,  # Reduced from 14746 to prevent OOM
-            'phi3.5:3.8b': 4096,
-            'llama3.2:1b': 4096,
-            'gemma2:2b': 4096,
-            # Medium models (7B range)
-            'openhermes:v2.5': 6144,
-            'mistral:7b': 6144,
-            'llama3.2:3b': 6144,
-            'llama3.1:7b': 6144,
-            # Larger models - keep higher context but still reasonable
-            'llama3.1:13b': 8192,
-            'llama3.1:70b': 8192,
-        }
-
-        # Get context length for specific model, with fallback to safe default
-        return context_map.get(model_name, 4096)
+        return _optimal_context_length(model_name)
 
     def get_optimal_thread_count(self) -> int:
         """
@@ -347,13 +830,7 @@ class LLMHelper:
         Returns:
             Optimal number of threads
         """
-        try:
-            import os
-            # Use half the available CPU cores for better system responsiveness
-            cpu_count = os.cpu_count() or 4
-            return max(2, min(8, cpu_count // 2))
-        except Exception:
-            return 4  # Safe default
+        return _OPTIMAL_THREADS
     
     def list_available_models(self) -> Dict[str, str]:
         """
@@ -363,27 +840,109 @@ class LLMHelper:
             Dictionary mapping agent names to their LLM models
         """
         config = self.load_agents_config()
-        models = {}
         
-        for agent_name, agent_config in config.items():
-            if 'llm' in agent_config:
-                models[agent_name] = agent_config['llm']
+        # Rebuilt only when load_agents_config returned a newly parsed config
+        if self._available_models is None or self._available_models[0] is not config:
+            self._available_models = (config, {
+                agent_name: agent_config['llm']
+                for agent_name, agent_config in config.items()
+                if isinstance(agent_config, dict) and 'llm' in agent_config
+            })
         
-        return models
+        return dict(self._available_models[1])
     
+    def warmup_ollama_models(self) -> List[str]:
+        """
+        Load every configured Ollama model into memory in the background,
+        so the first agent call hits a model that is already loaded
+
+        Returns:
+            List of model names scheduled for warm-up
+        """
+        try:
+            config = self.load_agents_config()
+            ollama_models = set()
+            for agent_name, agent_config in config.items():
+                if not isinstance(agent_config, dict) or 'llm' not in agent_config:
+                    continue
+                model_name = self.get_llm_model_name(agent_name)
+                if _detect_provider(model_name) != "ollama":
+                    continue
+                ollama_models.add(agent_config.get('fast_llm') or model_name)
+        except Exception as e:
+            logger.debug(f"Skipping Ollama warm-up, config not loadable: {e}")
+            return []
+
+        ollama_models = sorted(ollama_models)
+        if ollama_models:
+            # Daemon thread: a short run never waits at exit for a slow or unreachable Ollama
+            threading.Thread(
+                target=self._warmup_models,
+                args=(ollama_models,),
+                name="ollama-warmup",
+                daemon=True
+            ).start()
+        return ollama_models
+
+    def _warmup_models(self, model_names: List[str]) -> None:
+        """Warm up models one after another, so they don't compete for GPU memory while loading"""
+        for model_name in model_names:
+            self._warmup_model(model_name)
+
+    def _warmup_model(self, model_name: str) -> bool:
+        """Send an empty generate request so Ollama loads the model and keeps it loaded"""
+        try:
+            payload = {
+                "model": model_name,
+                "prompt": "",
+                "keep_alive": WARMUP_KEEP_ALIVE
+            }
+            response = _ollama_session().post(
+                f"{self.ollama_base_url}/api/generate",
+                json=payload,
+                timeout=(CONNECTION_TIMEOUT, WARMUP_TIMEOUT)
+            )
+            success = response.status_code == 200
+            if success:
+                logger.debug(f"Warmed up model: {model_name}")
+            return success
+        except Exception as e:
+            logger.debug(f"Could not warm up model {model_name}: {e}")
+            return False
+
     def validate_ollama_connection(self) -> bool:
         """
         Validate that Ollama is running and accessible
         
+        A successful check is reused for CONNECTION_CHECK_TTL seconds, so repeated
+        health checks do not each make a request. Failures are never cached, so a
+        server that was just started is picked up on the next check.
+        
         Returns:
             True if Ollama is accessible, False otherwise
         """
+        checked_at = self._connection_checks.get(self.ollama_base_url)
+        if checked_at is not None and time.monotonic() - checked_at < CONNECTION_CHECK_TTL:
+            return True
+        
+        url = f"{self.ollama_base_url}/api/tags"
+        timeout = (CONNECTION_TIMEOUT, DEFAULT_REQUEST_TIMEOUT)
         try:
-            import requests
-            response = requests.get(f"{self.ollama_base_url}/api/tags", timeout=5)
-            return response.status_code == 200
+            # HEAD skips downloading the model list; only the status matters
+            response = _ollama_session().head(url, timeout=timeout)
+            if response.status_code >= 400:
+                # Proxies or servers without HEAD support: stream the GET and close it unread
+                with _ollama_session().get(url, timeout=timeout, stream=True) as response:
+                    pass
+            connected = response.status_code == 200
         except Exception:
-            return False
+            connected = False
+        
+        if connected:
+            self._connection_checks[self.ollama_base_url] = time.monotonic()
+        else:
+            self._connection_checks.pop(self.ollama_base_url, None)
+        return connected
     
     def unload_model(self, model_name: str) -> bool:
         """
@@ -396,15 +955,14 @@ class LLMHelper:
             True if successful, False otherwise
         """
         try:
-            import requests
             payload = {
                 "model": model_name,
                 "keep_alive": 0  # Immediately unload
             }
-            response = requests.post(
+            response = _ollama_session().post(
                 f"{self.ollama_base_url}/api/generate",
                 json=payload,
-                timeout=DEFAULT_REQUEST_TIMEOUT
+                timeout=(CONNECTION_TIMEOUT, DEFAULT_REQUEST_TIMEOUT)
             )
             success = response.status_code == 200
             if success:
@@ -416,6 +974,54 @@ class LLMHelper:
             logger.warning(f"Could not unload model {model_name}: {e}")
             return False
     
+    def _unload_models(self, model_names: List[str]) -> Dict[str, bool]:
+        """
+        Unload several models at once instead of one request after another
+
+        Args:
+            model_names: Names of the models to unload
+
+        Returns:
+            Dictionary mapping model names to unload success status
+        """
+        if not model_names:
+            return {}
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._unload_models_async(model_names))
+
+        # Called from inside an event loop: run the batch on a helper thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self._unload_models_async(model_names)).result()
+
+    async def _unload_models_async(self, model_names: List[str]) -> Dict[str, bool]:
+        """Send all unload requests concurrently over one async client"""
+        import httpx
+
+        timeout = httpx.Timeout(DEFAULT_REQUEST_TIMEOUT, connect=CONNECTION_TIMEOUT)
+        async with httpx.AsyncClient(base_url=self.ollama_base_url, timeout=timeout) as client:
+            results = await asyncio.gather(
+                *(self._unload_model_async(client, model_name) for model_name in model_names)
+            )
+        return dict(zip(model_names, results))
+
+    async def _unload_model_async(self, client: "httpx.AsyncClient", model_name: str) -> bool:
+        """Async counterpart of unload_model using a shared client"""
+        try:
+            logger.debug(f"Unloading: {model_name}")
+            response = await client.post(
+                "/api/generate",
+                json={"model": model_name, "keep_alive": 0}
+            )
+            if response.status_code != 200:
+                logger.warning(f"Failed to unload model {model_name}: HTTP {response.status_code}")
+            return response.status_code == 200
+        except Exception as e:
+            logger.warning(f"Could not unload model {model_name}: {e}")
+            return False
+    
     def get_loaded_models(self) -> List[str]:
         """
         Get list of currently loaded models in Ollama
@@ -424,10 +1030,13 @@ class LLMHelper:
             List of loaded model names
         """
         try:
-            import requests
-            response = requests.get(f"{self.ollama_base_url}/api/ps", timeout=CONNECTION_TIMEOUT)
+            response = _ollama_session().get(
+                f"{self.ollama_base_url}/api/ps",
+                timeout=(CONNECTION_TIMEOUT, DEFAULT_REQUEST_TIMEOUT)
+            )
             if response.status_code == 200:
-                models_data = response.json()
+                # Parse the raw bytes directly; response.json() decodes to text first
+                models_data = orjson.loads(response.content) if orjson is not None else response.json()
                 models = [model.get('name', '') for model in models_data.get('models', [])]
                 logger.debug(f"Found {len(models)} loaded models: {models}")
                 return models
@@ -450,16 +1059,17 @@ class LLMHelper:
         
         if unused_models:
             logger.info(f"Unloading {len(unused_models)} unused models: {unused_models}")
-            for model in unused_models:
-                logger.debug(f"Unloading unused model: {model}")
-                self.unload_model(model)
+            self._unload_models(unused_models)
         else:
             logger.debug("No unused models to clean up")
     
-    def unload_all_models(self) -> Dict[str, bool]:
+    def unload_all_models(self, verify: bool = False) -> Dict[str, bool]:
         """
         Unload all currently loaded models to free GPU memory
 
+        Args:
+            verify: Ask Ollama afterwards which models are still loaded (one extra request)
+
         Returns:
             Dictionary mapping model names to unload success status
         """
@@ -472,24 +1082,24 @@ class LLMHelper:
 
         logger.info(f"Unloading all {len(loaded_models)} loaded models...")
 
-        for model in loaded_models:
-            if model:
-                logger.debug(f"Unloading: {model}")
-                success = self.unload_model(model)
-                results[model] = success
-                if success:
-                    logger.debug(f"Successfully unloaded: {model}")
-                else:
-                    logger.warning(f"Failed to unload: {model}")
+        results = self._unload_models([model for model in loaded_models if model])
+        for model, success in results.items():
+            if success:
+                logger.debug(f"Successfully unloaded: {model}")
+            else:
+                logger.warning(f"Failed to unload: {model}")
 
-        # Note: No LLM cache to clear (caching removed for simpler behavior)
-        logger.debug("LLM cache disabled - no cleanup needed")
+        # Cached LLM instances point at unloaded models; rebuild them on next use
+        self.clear_cache()
 
         # Verify cleanup
-        remaining_models = self.get_loaded_models()
-        if remaining_models:
-            logger.warning(f"{len(remaining_models)} models still loaded after cleanup: {remaining_models}")
-        else:
+        if verify:
+            remaining_models = self.get_loaded_models()
+            if remaining_models:
+                logger.warning(f"{len(remaining_models)} models still loaded after cleanup: {remaining_models}")
+            else:
+                logger.info("All models successfully unloaded - GPU memory freed!")
+        elif all(results.values()):
             logger.info("All models successfully unloaded - GPU memory freed!")
 
         return results
@@ -504,11 +1114,11 @@ class LLMHelper:
         try:
             logger.info("Starting comprehensive memory cleanup...")
 
-            # Step 1: Unload all models
+            # Step 1: Unload all models (verified below in step 4)
             unload_results = self.unload_all_models()
 
-            # Step 2: Note - LLM cache disabled for simpler behavior
-            logger.info("LLM cache disabled - no internal cache to clear")
+            # Step 2: Clear LLM instance cache (already done by unload_all_models)
+            self.clear_cache()
 
             # Step 3: Force garbage collection
             import gc
@@ -529,11 +1139,25 @@ class LLMHelper:
             logger.error(f"Error during memory cleanup: {e}")
             return False
     
-    def clear_cache(self) -> None:
+    @classmethod
+    def clear_cache(cls) -> None:
         """
-        Clear the LLM instance cache (disabled - no caching)
+        Clear the LLM instance cache shared by all helpers
         """
-        logger.info("LLM caching disabled - no cache to clear")
+        with cls._cache_lock:
+            cleared = len(cls._llm_cache)
+            cls._llm_cache.clear()
+            cls._llm_instances.clear()
+        logger.debug(f"Cleared {cleared} cached LLM instances")
+
+    def _clear_config_cache(self) -> None:
+        """Drop the cached LLM instances built from this helper's config file"""
+        config_key = str(self.config_path)
+        with self._cache_lock:
+            stale_keys = [key for key in self._llm_cache if key[0] == config_key]
+            for key in stale_keys:
+                del self._llm_cache[key]
+        logger.debug(f"Cleared {len(stale_keys)} cached LLM instances for {config_key}")
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """
@@ -542,10 +1166,15 @@ class LLMHelper:
         Returns:
             Dictionary with cache statistics
         """
+        settings = self._build_settings()
         return {
-            'cached_instances': 0,
-            'cached_agents': [],
-            'cache_enabled': False
+            'cached_instances': len(self._llm_cache),
+            'distinct_instances': len(self._llm_instances),
+            'cached_agents': [
+                agent_name for config_key, agent_name, agent_settings in list(self._llm_cache)
+                if config_key == str(self.config_path) and agent_settings == settings
+            ],
+            'cache_enabled': True
         }
     
     def list_github_models(self) -> List[str]:
@@ -587,6 +1216,23 @@ class LLMHelper:
         }
 
 
+@lru_cache(maxsize=8)
+def get_llm_helper(config_path: Optional[str] = None) -> LLMHelper:
+    """
+    Get the process-wide LLMHelper for a config file
+
+    Sharing the helper keeps its parsed config and LLM instance cache alive
+    across crew runs, so repeated kickoffs reuse the same LLM clients.
+
+    Args:
+        config_path: Optional path to agents.yaml
+
+    Returns:
+        Shared LLMHelper instance
+    """
+    return LLMHelper(config_path)
+
+
 # Convenience function for quick LLM creation
 def create_llm(agent_name: str, config_path: Optional[str] = None) -> LLM:
     """
@@ -599,7 +1245,7 @@ def create_llm(agent_name: str, config_path: Optional[str] = None) -> LLM:
     Returns:
         Configured LLM instance
     """
-    helper = LLMHelper(config_path)
+    helper = get_llm_helper(str(config_path) if config_path is not None else None)
     return helper.create_llm_instance(agent_name)
 
 
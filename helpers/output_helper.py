@@ -6,10 +6,19 @@ with proper file naming and directory structure.
 """
 
 import os
+import shutil
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, Any, Optional
 from pathlib import Path
 
+# Upper bound on files written in parallel by save_multiple_outputs
+MAX_PARALLEL_WRITES = 8
+
+# Characters that aren't safe in filenames, mapped to '_' for a single str.translate pass
+_SANITIZE_TABLE = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
+
 
 class OutputHelper:
     """Helper class for managing flow output files."""
@@ -27,17 +36,13 @@ class OutputHelper:
         """Ensure the specified directory exists."""
         directory_path.mkdir(parents=True, exist_ok=True)
         
-    def _generate_timestamp(self) -> str:
+    def generate_timestamp(self) -> str:
         """Generate timestamp string for file naming."""
         return datetime.now().strftime("%Y%m%d_%H%M%S")
         
     def _sanitize_filename(self, filename: str) -> str:
         """Sanitize filename by removing/replacing invalid characters."""
-        # Remove or replace characters that aren't safe for filenames
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
-        return filename
+        return filename.translate(_SANITIZE_TABLE)
         
     def save_content(
         self, 
@@ -46,7 +51,8 @@ class OutputHelper:
         filename_prefix: str = "output",
         file_extension: str = "md",
         include_timestamp: bool = True,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[str] = None
     ) -> str:
         """
         Save content to a file in the appropriate flow directory.
@@ -58,16 +64,111 @@ class OutputHelper:
             file_extension: File extension (without dot)
             include_timestamp: Whether to include timestamp in filename
             metadata: Optional metadata to include at top of file
+            timestamp: Pre-generated timestamp to use instead of the current time
+            
+        Returns:
+            str: Full path to the saved file
+        """
+        file_path = self._build_output_path(flow_name, filename_prefix, file_extension, include_timestamp, timestamp)
+        
+        # Save file, writing the optional metadata header separately so the
+        # content is never copied into a second, concatenated string
+        with open(file_path, 'w', encoding='utf-8') as f:
+            if metadata:
+                f.write(f"{self._format_metadata(metadata)}\n\n")
+            f.write(content)
+            
+        return str(file_path)
+        
+    async def asave_content(self, flow_name: str, content: str, **kwargs: Any) -> str:
+        """
+        Async version of save_content that writes the file in a worker thread
+        so the event loop stays free for other flows.
+        
+        Args:
+            flow_name: Name of the flow (used for subdirectory)
+            content: Content to save
+            **kwargs: Same options as save_content
             
         Returns:
             str: Full path to the saved file
         """
+        return await asyncio.to_thread(self.save_content, flow_name, content, **kwargs)
+        
+    async def amove_content(self, flow_name: str, source_path: Path, **kwargs: Any) -> str:
+        """
+        Async version of move_content that moves the file in a worker thread.
+        
+        Args:
+            flow_name: Name of the flow (used for subdirectory)
+            source_path: File holding the content (removed afterwards)
+            **kwargs: Same options as move_content
+            
+        Returns:
+            str: Full path to the saved file
+        """
+        return await asyncio.to_thread(self.move_content, flow_name, source_path, **kwargs)
+        
+    def move_content(
+        self,
+        flow_name: str,
+        source_path: Path,
+        filename_prefix: str = "output",
+        file_extension: str = "md",
+        include_timestamp: bool = True,
+        metadata: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[str] = None
+    ) -> str:
+        """
+        Move an already written file into the flow directory.
+        
+        Without metadata the file is renamed in place; with metadata the
+        frontmatter is written first and the source is streamed after it.
+        
+        Args:
+            flow_name: Name of the flow (used for subdirectory)
+            source_path: File holding the content (removed afterwards)
+            filename_prefix: Prefix for the filename
+            file_extension: File extension (without dot)
+            include_timestamp: Whether to include timestamp in filename
+            metadata: Optional metadata to include at top of file
+            timestamp: Pre-generated timestamp to use instead of the current time
+            
+        Returns:
+            str: Full path to the saved file
+        """
+        file_path = self._build_output_path(flow_name, filename_prefix, file_extension, include_timestamp, timestamp)
+        source_path = Path(source_path)
+        
+        if not metadata:
+            shutil.move(str(source_path), str(file_path))
+            return str(file_path)
+        
+        with open(file_path, 'w', encoding='utf-8') as dest, open(source_path, 'r', encoding='utf-8') as src:
+            dest.write(f"{self._format_metadata(metadata)}\n\n")
+            shutil.copyfileobj(src, dest)
+        source_path.unlink()
+        
+        return str(file_path)
+        
+    def _build_output_path(
+        self,
+        flow_name: str,
+        filename_prefix: str,
+        file_extension: str,
+        include_timestamp: bool,
+        timestamp: Optional[str] = None
+    ) -> Path:
+        """Create the flow directory and return the sanitized output file path."""
         # Create flow-specific directory
         flow_dir = self.base_output_dir / flow_name
         self._ensure_directory_exists(flow_dir)
         
         # Generate filename
-        timestamp = self._generate_timestamp() if include_timestamp else ""
+        if not include_timestamp:
+            timestamp = ""
+        elif timestamp is None:
+            timestamp = self.generate_timestamp()
         filename_parts = [filename_prefix]
         if timestamp:
             filename_parts.append(timestamp)
@@ -75,19 +176,7 @@ class OutputHelper:
         filename = f"{'_'.join(filename_parts)}.{file_extension}"
         filename = self._sanitize_filename(filename)
         
-        file_path = flow_dir / filename
-        
-        # Prepare content with optional metadata
-        final_content = content
-        if metadata:
-            metadata_section = self._format_metadata(metadata)
-            final_content = f"{metadata_section}\n\n{content}"
-            
-        # Save file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(final_content)
-            
-        return str(file_path)
+        return flow_dir / filename
         
     def _format_metadata(self, metadata: Dict[str, Any]) -> str:
         """Format metadata as markdown frontmatter or comment section."""
@@ -104,7 +193,8 @@ class OutputHelper:
         filename_prefix: str = "output",
         file_extension: str = "md",
         include_timestamp: bool = True,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[str] = None
     ) -> Dict[str, str]:
         """
         Save multiple outputs (e.g., different content types from same flow).
@@ -116,28 +206,35 @@ class OutputHelper:
             file_extension: File extension
             include_timestamp: Whether to include timestamp
             metadata: Optional metadata for all files
+            timestamp: Pre-generated timestamp shared by all files (defaults to now)
             
         Returns:
             Dict[str, str]: Mapping of output_type -> saved_file_path
         """
-        saved_files = {}
+        if not outputs:
+            return {}
+        
+        # One timestamp for the whole set, so related files share a name suffix
+        if include_timestamp and timestamp is None:
+            timestamp = self.generate_timestamp()
         
-        for output_type, content in outputs.items():
+        def _save(output_type: str, content: str) -> str:
             # Create specific filename for this output type
-            specific_prefix = f"{filename_prefix}_{output_type}"
-            
-            file_path = self.save_content(
+            return self.save_content(
                 flow_name=flow_name,
                 content=content,
-                filename_prefix=specific_prefix,
+                filename_prefix=f"{filename_prefix}_{output_type}",
                 file_extension=file_extension,
                 include_timestamp=include_timestamp,
-                metadata=metadata
+                metadata=metadata,
+                timestamp=timestamp
             )
+        
+        # Files are independent, so write them side by side instead of one after another
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_WRITES, len(outputs))) as executor:
+            saved_paths = executor.map(_save, outputs.keys(), outputs.values())
             
-            saved_files[output_type] = file_path
-            
-        return saved_files
+        return dict(zip(outputs.keys(), saved_paths))
         
     def get_output_directory(self, flow_name: str) -> str:
         """Get the output directory path for a specific flow."""
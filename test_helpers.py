@@ -0,0 +1,97 @@
+"""
+Tests for the knowledge and output helpers' file handling.
+
+Neither helper needs crewai or an LLM server. Run with: pytest test_helpers.py
+"""
+
+import json
+import shutil
+
+from helpers.knowledge_helper import KnowledgeHelper, MAX_STORED_SEARCHES
+from helpers.output_helper import OutputHelper
+
+
+def test_legacy_web_results_migrated_to_jsonl(tmp_path):
+    knowledge_dir = tmp_path / "knowledge"
+    knowledge_dir.mkdir()
+    searches = [{"query": f"q{i}", "results": []} for i in range(MAX_STORED_SEARCHES + 10)]
+    (knowledge_dir / "web_search_results.json").write_text(json.dumps({"searches": searches}))
+
+    helper = KnowledgeHelper(str(tmp_path))
+    recent = helper.read_recent_web_results()
+
+    assert [entry["query"] for entry in recent] == [entry["query"] for entry in searches[-MAX_STORED_SEARCHES:]]
+    assert not helper.legacy_web_results_file.exists()
+    assert helper.web_results_count_file.read_text() == str(MAX_STORED_SEARCHES)
+
+
+def test_corrupt_legacy_web_results_kept(tmp_path):
+    knowledge_dir = tmp_path / "knowledge"
+    knowledge_dir.mkdir()
+    legacy_file = knowledge_dir / "web_search_results.json"
+    legacy_file.write_text('{"searches": [{"query": "q0"')
+
+    helper = KnowledgeHelper(str(tmp_path))
+
+    assert helper.read_recent_web_results() == []
+    assert legacy_file.read_text() == '{"searches": [{"query": "q0"'
+
+
+def test_web_results_log_compacted(tmp_path):
+    helper = KnowledgeHelper(str(tmp_path))
+    for i in range(2 * MAX_STORED_SEARCHES):
+        assert helper.store_web_search_results(f"q{i}", [])
+
+    lines = helper.web_results_file.read_bytes().splitlines()
+    assert len(lines) == MAX_STORED_SEARCHES
+    assert json.loads(lines[0])["query"] == f"q{MAX_STORED_SEARCHES}"
+    assert helper.read_recent_web_results(1)[0]["query"] == f"q{2 * MAX_STORED_SEARCHES - 1}"
+
+
+def test_store_web_results_after_knowledge_dir_deleted(tmp_path):
+    helper = KnowledgeHelper(str(tmp_path))
+    assert helper.store_web_search_results("first", [])
+
+    shutil.rmtree(tmp_path / "knowledge")
+
+    assert helper.store_web_search_results("second", [])
+    assert helper.read_recent_web_results(1)[0]["query"] == "second"
+
+
+def test_move_content_without_metadata(tmp_path):
+    source = tmp_path / "task_output.md"
+    source.write_text("# Draft")
+    helper = OutputHelper(str(tmp_path / "output"))
+
+    saved_path = helper.move_content("test", source, filename_prefix="blog", include_timestamp=False)
+
+    assert saved_path == str(tmp_path / "output" / "test" / "blog.md")
+    assert (tmp_path / "output" / "test" / "blog.md").read_text() == "# Draft"
+    assert not source.exists()
+
+
+def test_move_content_with_metadata(tmp_path):
+    source = tmp_path / "task_output.md"
+    source.write_text("# Draft")
+    helper = OutputHelper(str(tmp_path / "output"))
+
+    saved_path = helper.move_content(
+        "test", source, filename_prefix="blog", metadata={"topic": "testing"}, timestamp="20260101_000000"
+    )
+
+    with open(saved_path, encoding="utf-8") as f:
+        assert f.read() == "---\ntopic: testing\n---\n\n# Draft"
+    assert saved_path.endswith("blog_20260101_000000.md")
+    assert not source.exists()
+
+
+def test_save_content_after_output_dir_deleted(tmp_path):
+    helper = OutputHelper(str(tmp_path / "output"))
+    helper.save_content("test", "first", filename_prefix="first", include_timestamp=False)
+
+    shutil.rmtree(tmp_path / "output")
+    saved_path = helper.save_content("test", "second", filename_prefix="second", include_timestamp=False)
+
+    with open(saved_path, encoding="utf-8") as f:
+        assert f.read() == "second"
+
@@ -0,0 +1,69 @@
+"""
+Tests for LLMHelper's shared LLM instance cache.
+
+LLM objects are only constructed, never called, so no LLM server is needed.
+Run with: pytest test_llm_helper.py
+"""
+
+import pytest
+
+pytest.importorskip("crewai")
+
+from helpers.llm_helper import CachingLLM, LLMHelper
+
+AGENTS_YAML = """\
+writer:
+  role: Writer
+  llm: gpt-4o-mini
+"""
+
+
+@pytest.fixture
+def agents_config(tmp_path, monkeypatch):
+    """An OpenAI-only agents.yaml, with the LLM environment variables reset"""
+    # Keep a local .env from changing the environment under test
+    monkeypatch.setattr(LLMHelper, "_dotenv_loaded", True)
+    for name in ("GITHUB_TOKEN", "LLM_RESPONSE_CACHE", "LLM_RESPONSE_CACHE_DIR", "LLM_RESPONSE_CACHE_SAMPLED",
+                 "LLM_PRELOAD"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("OPENAI_API_KEY", "key-one")
+
+    config_path = tmp_path / "agents.yaml"
+    config_path.write_text(AGENTS_YAML)
+    return config_path
+
+
+def test_llm_instance_shared_between_helpers(agents_config):
+    first = LLMHelper(agents_config).create_llm_instance("writer")
+    second = LLMHelper(agents_config).create_llm_instance("writer")
+
+    assert first is second
+
+
+def test_llm_instance_rebuilt_when_api_key_changes(agents_config, monkeypatch):
+    first = LLMHelper(agents_config).create_llm_instance("writer")
+    monkeypatch.setenv("OPENAI_API_KEY", "key-two")
+    second = LLMHelper(agents_config).create_llm_instance("writer")
+
+    assert second is not first
+    assert second.api_key == "key-two"
+
+
+def test_response_cache_skips_sampled_llms(agents_config, monkeypatch, tmp_path):
+    monkeypatch.setenv("LLM_RESPONSE_CACHE", "1")
+    monkeypatch.setenv("LLM_RESPONSE_CACHE_DIR", str(tmp_path / "llm_cache"))
+    llm = LLMHelper(agents_config).create_llm_instance("writer")
+
+    # OpenAI models are built with temperature 0.7
+    assert not isinstance(llm, CachingLLM)
+
+
+def test_llm_instance_rebuilt_when_response_cache_enabled(agents_config, monkeypatch, tmp_path):
+    first = LLMHelper(agents_config).create_llm_instance("writer")
+    monkeypatch.setenv("LLM_RESPONSE_CACHE", "1")
+    monkeypatch.setenv("LLM_RESPONSE_CACHE_DIR", str(tmp_path / "llm_cache"))
+    monkeypatch.setenv("LLM_RESPONSE_CACHE_SAMPLED", "1")
+    second = LLMHelper(agents_config).create_llm_instance("writer")
+
+    assert not isinstance(first, CachingLLM)
+    assert isinstance(second, CachingLLM)
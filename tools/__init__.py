@@ -6,5 +6,6 @@ Tools are designed to be flow-agnostic and reusable.
 """
 
 from .search_tool import search_tool
+from .bulk_scrape_tool import bulk_scrape_tool
 
-__all__ = ["search_tool"]
\ No newline at end of file
+__all__ = ["search_tool", "bulk_scrape_tool"]
\ No newline at end of file
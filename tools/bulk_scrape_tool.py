@@ -0,0 +1,132 @@
+"""
+Bulk scrape tool
+
+Fetches a list of URLs concurrently in a single tool call, so researching
+several sources costs roughly one page latency instead of the sum of them.
+The async client lives on a background event loop shared by all tool calls,
+so its pooled connections are reused across calls.
+"""
+import asyncio
+import re
+import threading
+from typing import List, Optional
+
+import httpx
+from bs4 import BeautifulSoup
+from crewai.tools import tool
+
+from tools.http_client import (
+    DEFAULT_TIMEOUT,
+    HTTP2_AVAILABLE,
+    MAX_CONNECTIONS,
+    MAX_KEEPALIVE_CONNECTIONS,
+)
+
+MAX_CONCURRENT_FETCHES = 20
+# Keep each page small enough that a full batch still fits in the agent's context
+MAX_CHARS_PER_PAGE = 8000
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+_async_client: Optional[httpx.AsyncClient] = None
+
+
+def page_text(content: bytes) -> str:
+    """
+    Extract readable text from an HTML page
+
+    Args:
+        content: Raw HTML bytes
+
+    Returns:
+        Page text with whitespace collapsed
+    """
+    parsed = BeautifulSoup(content, "html.parser")
+    text = parsed.get_text(" ")
+    text = re.sub("[ \t]+", " ", text)
+    text = re.sub("\\s+\n\\s+", "\n", text)
+    return text.strip()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Get the background event loop that runs every bulk scrape"""
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="bulk-scrape-loop", daemon=True).start()
+                _loop = loop
+    return _loop
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """Get the shared async client; only called on the background loop, so no lock is needed"""
+    global _async_client
+    if _async_client is None:
+        _async_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=MAX_CONNECTIONS
+            ),
+            timeout=DEFAULT_TIMEOUT,
+            follow_redirects=True
+        )
+    return _async_client
+
+
+async def _fetch_all(urls: List[str]) -> List[str]:
+    """Fetch all URLs concurrently, at most MAX_CONCURRENT_FETCHES at a time"""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+    client = _get_async_client()
+
+    async def fetch(url: str) -> str:
+        async with semaphore:
+            response = await client.get(url)
+            response.raise_for_status()
+        # Parse off the loop so large pages don't stall the other downloads
+        text = await asyncio.to_thread(page_text, response.content)
+        return text[:MAX_CHARS_PER_PAGE]
+
+    return await asyncio.gather(*(fetch(url) for url in urls), return_exceptions=True)
+
+
+def _run_fetch_all(urls: List[str]) -> List[str]:
+    """Run the async fetch on the background loop, from any thread"""
+    return asyncio.run_coroutine_threadsafe(_fetch_all(urls), _get_loop()).result()
+
+
+@tool("Bulk Scrape Websites")
+def bulk_scrape_tool(urls: List[str]) -> str:
+    """
+    Scrape the text content of several websites at once.
+    When multiple URLs are needed, call this tool once with the full list
+    instead of scraping them one by one.
+
+    Args:
+        urls (List[str]): The website URLs to scrape
+
+    Returns:
+        str: The text content of each website, one section per URL
+    """
+    # De-duplicate while keeping the agent's ordering
+    urls = list(dict.fromkeys(url.strip() for url in urls if url and url.strip()))
+    if not urls:
+        return "No URLs provided."
+
+    try:
+        pages = _run_fetch_all(urls)
+    except Exception as e:
+        error_msg = f"Error scraping websites: {str(e)}"
+        print(f"Bulk scrape tool error: {error_msg}")
+        return f"Bulk scrape failed: {error_msg}"
+
+    sections = []
+    for url, page in zip(urls, pages):
+        if isinstance(page, Exception):
+            sections.append(f"## {url}\n\nFailed to scrape: {page}")
+        else:
+            sections.append(f"## {url}\n\n{page}")
+
+    return "The following text is scraped website content:\n\n" + "\n\n---\n\n".join(sections)
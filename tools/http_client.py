@@ -0,0 +1,52 @@
+"""
+Shared HTTP client for tools
+
+Keeps one pooled connection per host alive across tool calls, so repeated
+scrapes reuse TCP/TLS connections instead of opening a new one per request.
+HTTP/2 is enabled when the optional 'h2' package is installed.
+"""
+import importlib.util
+import threading
+from typing import Optional
+
+import httpx
+
+DEFAULT_TIMEOUT = 15
+MAX_KEEPALIVE_CONNECTIONS = 100
+MAX_CONNECTIONS = 200
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Get the process-wide pooled HTTP client
+    
+    Returns:
+        Shared httpx.Client instance
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(
+                    http2=HTTP2_AVAILABLE,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                        max_connections=MAX_CONNECTIONS
+                    ),
+                    timeout=DEFAULT_TIMEOUT,
+                    follow_redirects=True
+                )
+    return _client
+
+
+def close_http_client() -> None:
+    """Close the shared HTTP client and its pooled connections"""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
@@ -0,0 +1,24 @@
+from typing import Any
+
+from crewai_tools import ScrapeWebsiteTool
+
+from tools.bulk_scrape_tool import page_text
+from tools.http_client import get_http_client
+
+
+class PooledScrapeWebsiteTool(ScrapeWebsiteTool):
+    """
+    ScrapeWebsiteTool that fetches pages through the shared pooled HTTP client
+    instead of opening a new connection for every URL.
+    """
+
+    def _run(self, **kwargs: Any) -> Any:
+        website_url = kwargs.get("website_url", self.website_url)
+        headers = self.headers
+        if self.cookies:
+            # Sent as a header: per-request cookies are deprecated in httpx and would
+            # be stored in the shared client's jar, leaking into other tools' requests
+            cookie_header = "; ".join(f"{name}={value}" for name, value in self.cookies.items())
+            headers = {**(headers or {}), "Cookie": cookie_header}
+        response = get_http_client().get(website_url, headers=headers)
+        return "The following text is scraped website content:\n\n" + page_text(response.content)